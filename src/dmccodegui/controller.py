@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import logging
 import sys as _sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from .utils.transport import CommError
 
@@ -18,15 +20,6 @@ try:
 except ImportError:
     gclib = None  # type: ignore
     GCLIB_AVAILABLE = False
-# Create the global handle lazily/safely
-if GCLIB_AVAILABLE:
-    try:
-        global_dmc = gclib.py()
-    except Exception as e:  # pragma: no cover
-        logger.error("Failed to create gclib handle: %s", e)
-        global_dmc = None  # type: ignore
-else:
-    global_dmc = None  # type: ignore
 
 
 class GalilDriverProtocol:
@@ -79,7 +72,140 @@ PRIMARY_FLAGS: str = (
     else "--direct --timeout 1000"
 )
 
-FLOAT_CHARS = set("0123456789+-.eE")
+# Poll-frequency commands that cmd() does not log (avoids a 10 Hz log flood).
+_QUIET_CMD_PREFIXES = (
+    "MG _TP", "MG _TS", "MG _TD", "MG hmi", "MG ct", "MG _XQ",
+    "MG aPos", "MG bPos", "MG cPos", "MG dPos",
+)
+
+# read_status(): positions A-D then A-axis speed in one MG
+STATUS_CMD = "MG _TPA,_TPB,_TPC,_TPD,_TSA"
+
+# _read_status_per_field(): one MG per axis position, then speed
+_TP_CMDS = tuple((axis, f"MG _TP{axis}") for axis in "ABCD")
+_TS_CMD = "MG _TSA"
+
+# cmd() error path: fetch the controller's error code and message
+_TC1_CMD = "TC1"
+
+# Seconds a TC1 reply is reused when the same command fails again.
+TC1_TTL_S = 0.1
+
+# Empty _error_text cache: (monotonic ts, failed command, TC1 reply)
+_NO_TC1: tuple[float, str, str] = (0.0, "", "")
+
+# verify_connection(): benign query that any connected controller answers
+VERIFY_CMD = "MG{Z10.0} _SPA"
+
+# Seconds a successful verify_connection() probe is trusted without re-asking.
+VERIFY_TTL_S = 0.5
+
+# read_status() results younger than this are returned without a round-trip.
+STATUS_TTL_MS = 25.0
+
+# Longest command line the DMC parser accepts in one GCommand.
+CMD_LINE_MAX = 300
+
+# GArrayDownload calling conventions download_array() probes, in order.
+_DOWNLOAD_MODES = ("list", "ascii_delim", "cmd")
+
+# Seconds a GAddresses() scan result is reused by list_addresses().
+ADDRESS_CACHE_TTL_S = 5.0
+
+# CR/LF/comma -> space, so str.split() sees a plain space-separated list
+_SEP_TABLE = str.maketrans(",\r\n", "   ")
+
+
+def _split_tokens(text: str) -> List[str]:
+    """Split a controller reply into tokens: one translate pass, one C split."""
+    return text.translate(_SEP_TABLE).split()
+
+
+def _parse_floats(text: str) -> List[float]:
+    """Parse a controller reply into a list of floats.
+
+    Raises:
+        ValueError: If any token is not a number (e.g. ``"?"``).
+    """
+    return [float(tok) for tok in _split_tokens(text)]
+
+
+def parse_number_list(text: str, limit: Optional[int] = None) -> List[float]:
+    """Parse a comma/whitespace separated controller reply into floats.
+
+    With *limit*, only the first *limit* tokens are converted.
+
+    Raises:
+        ValueError: If any converted token is not a number (e.g. ``"?"``).
+    """
+    tokens = _split_tokens(text)
+    if limit is not None:
+        tokens = tokens[:limit]
+    return [float(tok) for tok in tokens]
+
+
+def _is_undeclared_array(tc1: str) -> bool:
+    """True if a TC1 reply is error 57, "Bad function or array"."""
+    return "Bad function or array" in tc1 or tc1.strip().startswith("57")
+
+
+def _poll_delay(attempt: int, min_s: float, max_s: float) -> float:
+    """Sleep before re-probe *attempt* (0-based): *min_s* doubling up to *max_s*."""
+    return min(min_s * (1 << min(attempt, 16)), max_s)
+
+
+def _log_noop(_msg: str) -> None:
+    """Default UI logger: drops the message (no None check per command)."""
+
+
+def _safe_log(fn: Callable[[str], None]) -> Callable[[str], None]:
+    """Wrap a UI logger so its errors never escape into controller I/O.
+
+    The try/except lives here once, so call sites are a bare ``self._log(msg)``.
+    """
+    def log(msg: str) -> None:
+        try:
+            fn(msg)
+        except Exception:
+            logger.debug("UI logger raised", exc_info=True)
+    return log
+
+
+@functools.lru_cache(maxsize=32)
+def _ref_template(name: str, chunk: int) -> str:
+    """Return ``name[{}],...`` with *chunk* format placeholders.
+
+    Shared by every chunk of the same size, whatever its start offset.
+    """
+    return ",".join([f"{name}[{{}}]"] * chunk)
+
+
+@functools.lru_cache(maxsize=64)
+def _array_refs(name: str, start: int, stop: int) -> str:
+    """Return the MG operand list ``name[start],...,name[stop-1]``.
+
+    Cached because array reads repeat the same (name, range) chunks on every
+    refresh; a miss is one str.format over the cached size template.
+    """
+    return _ref_template(name, stop - start).format(*range(start, stop))
+
+
+def _populated_length(values: Iterable[float], zero_run: int) -> int:
+    """Return last non-zero index + 1, scanning until *zero_run* zeros in a row.
+
+    *values* may be a lazy iterator; nothing past the zero run is consumed.
+    """
+    last_nonzero = -1
+    zeros = 0
+    for i, val in enumerate(values):
+        if abs(val) < 1e-9:
+            zeros += 1
+            if zeros >= zero_run and i > 0:
+                break
+        else:
+            last_nonzero = i
+            zeros = 0
+    return last_nonzero + 1
 
 
 class GalilController:
@@ -93,39 +219,93 @@ class GalilController:
     Inject a mock GalilDriverProtocol in tests to avoid requiring gclib.
     """
 
+    # Fixed attribute set: no per-instance __dict__ on the object every
+    # poll tick touches. New state must be added here as well as in __init__.
+    __slots__ = (
+        "_driver", "_gcommand", "_array_upload", "_array_download",
+        "_download_mode", "_qu_unavailable", "_driver_lock", "_connected", "_log", "_max_edges",
+        "_address", "_addr_cache", "_addr_ts", "_verify_ts",
+        "_status_cache", "_tc1_cache", "_edge_cache", "_length_cache",
+    )
+
     def __init__(self, driver: Optional[GalilDriverProtocol] = None) -> None:
-        self._driver = driver
+        self._driver = None
+        self._gcommand = None  # cached driver.GCommand bound method
+        self._array_upload = None  # cached driver.GArrayUpload, if it has one
+        self._array_download = None  # cached driver.GArrayDownload, if it has one
+        self._download_mode: Optional[str] = None  # see download_array
+        self._qu_unavailable = False  # see upload_array
+        self._driver_lock = threading.Lock()  # guards gclib.py() creation
+        self._set_driver(driver)
         self._connected = False
-        self._logger: Optional[callable] = None
+        self._log: Callable[[str], None] = _log_noop  # see set_logger
         self._max_edges: int = MAX_EDGES_DEFAULT
-        self._transport = None
         self._address: str = ""
+        self._addr_cache: Optional[Dict[str, str]] = None
+        self._addr_ts: float = 0.0
+        self._verify_ts: float = 0.0
+        self._status_cache: tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._tc1_cache = _NO_TC1  # see _error_text
+        # get_edges_*(): array name -> (monotonic ts, first index, values)
+        self._edge_cache: Dict[str, tuple[float, int, List[float]]] = {}
+        # discover_length(): array name -> (monotonic ts, limit, zero_run, length)
+        self._length_cache: Dict[str, tuple[float, int, int, int]] = {}
+
+    def _set_driver(self, driver: Optional[GalilDriverProtocol]) -> None:
+        """Install *driver* and cache its GCommand/GArray* bound methods."""
+        self._driver = driver
+        self._gcommand = driver.GCommand if driver is not None else None
+        self._array_upload = getattr(driver, "GArrayUpload", None)
+        self._array_download = getattr(driver, "GArrayDownload", None)
+        self._download_mode = None
+        self._qu_unavailable = False
+
+    def _ensure_driver(self) -> Optional[GalilDriverProtocol]:
+        """Return the driver, creating the gclib handle once if none is installed.
+
+        The handle is kept for the controller's lifetime: disconnect() only
+        GCloses it, and connect()/list_addresses() reuse it. Creation is
+        locked so an address scan on the jobs worker and a connect() racing
+        it cannot each build a handle. Returns None (after logging) when
+        gclib is missing or the handle cannot be created.
+        """
+        if self._driver is not None:
+            return self._driver
+        with self._driver_lock:
+            if self._driver is None:
+                if not GCLIB_AVAILABLE:
+                    logger.error("gclib not installed")
+                    return None
+                try:
+                    self._set_driver(gclib.py())
+                except Exception as e:  # pragma: no cover
+                    logger.error("Failed to create gclib driver: %s", e)
+                    return None
+        return self._driver
 
     #logging
-    def set_logger(self, fn: Optional[callable]) -> None:
+    def set_logger(self, fn: Optional[Callable[[str], None]]) -> None:
         """Register a callable for user-visible log messages from the controller.
 
         Args:
             fn: Callable(message: str) that receives log output, or None to disable.
         """
-        self._logger = fn
+        self._log = _safe_log(fn) if fn else _log_noop
 
     # Populates and discovers a list of connected addresses
-    def list_addresses(self) -> Dict[str, str]:
+    def list_addresses(self, force: bool = False) -> Dict[str, str]:
         """Return mapping of address -> description/revision if available.
 
-        Uses gclib GAddresses when the underlying driver implements it.
+        Uses gclib GAddresses when the underlying driver implements it. The
+        scan is slow and rarely changes between clicks, so a successful result
+        is reused for ADDRESS_CACHE_TTL_S seconds unless *force* is True.
         """
-        drv = self._driver
+        if (not force and self._addr_cache is not None
+                and time.monotonic() - self._addr_ts < ADDRESS_CACHE_TTL_S):
+            return dict(self._addr_cache)
+        drv = self._ensure_driver()
         if drv is None:
-            if not GCLIB_AVAILABLE:
-                logger.error("GAddresses unavailable: gclib not installed")
-                return {}
-            try:
-                drv = gclib.py()
-            except Exception as e:  # pragma: no cover
-                logger.error("GAddresses unavailable: %s", e)
-                return {}
+            return {}
         try:
             addrs = getattr(drv, "GAddresses", None)
             if not addrs:
@@ -133,10 +313,12 @@ class GalilController:
             result = addrs()
             # result may be dict-like
             items: Dict[str, str] = dict(result) if result else {}
-            return items
         except Exception as e:
             logger.error("list_addresses error: %s", e)
             return {}
+        self._addr_cache = items
+        self._addr_ts = time.monotonic()
+        return dict(items)
 
     @staticmethod
     def _strip_flags(address: str) -> str:
@@ -159,25 +341,31 @@ class GalilController:
         PRIMARY_FLAGS. Sends ``CW2,1`` after connect to put the controller in
         third-party device mode so MG output does not stall program execution.
 
+        Reconnecting to the address the open handle already serves reuses it
+        after a verify probe instead of paying a fresh GOpen. Connecting
+        elsewhere GCloses the old handle first so it is not leaked.
+
         Args:
             address: Controller IP/hostname, optionally with gclib flags.
 
         Returns:
             True on success; False if gclib is unavailable or GOpen fails.
         """
-        if self._driver is None:
-            if not GCLIB_AVAILABLE:
-                logger.error("Failed to connect: gclib not installed")
-                return False
-            try:
-                self._driver = gclib.py()
-            except Exception as e:  # pragma: no cover
-                logger.error("Failed to create gclib driver: %s", e)
-                return False
+        if self._ensure_driver() is None:
+            return False
         bare_addr = self._strip_flags(address)
+        if self._connected:
+            if bare_addr == self._address and self.verify_connection():
+                return True
+            try:
+                self._driver.GClose()
+            except Exception:
+                pass
+            self._connected = False
         try:
             self._driver.GOpen(f"{bare_addr} {PRIMARY_FLAGS}")
             self._connected = True
+            self._qu_unavailable = False  # may be different firmware
             self._address = bare_addr  # Store bare address (without flags) for reset_handle / MG handle
             # CW2,1: third-party device mode + continue on buffer full.
             #   n0=2: normal ASCII on unsolicited messages (no MSB mangling).
@@ -189,14 +377,10 @@ class GalilController:
             # when the buffer is full, causing commands to queue until #AUTO
             # re-enters its polling loop.
             try:
-                self._driver.GCommand("CW2,1")
+                self._gcommand("CW2,1")
             except Exception:
                 pass  # best-effort; some firmware revisions may not need it
-            if self._logger:
-                try:
-                    self._logger(f"[CTRL] Connected to {address} --direct, timeout=1000ms")
-                except Exception:
-                    pass
+            self._log(f"[CTRL] Connected to {address} --direct, timeout=1000ms")
             return True
         except Exception as e:
             logger.error("connect error: %s", e)
@@ -207,8 +391,8 @@ class GalilController:
     def disconnect(self) -> None:
         """Close the gclib handle and reset connected state.
 
-        Safe to call when already disconnected. After disconnect, the next
-        call to connect() creates a fresh driver handle.
+        Safe to call when already disconnected. The gclib driver object is
+        kept, so the next connect() only has to GOpen it again.
         """
         if self._driver is None:
             return
@@ -218,12 +402,10 @@ class GalilController:
             pass
         finally:
             self._connected = False
-            self._driver = None  # allow connect() to create a fresh handle on reconnect
-            if self._logger:
-                try:
-                    self._logger("Disconnected")
-                except Exception:
-                    pass
+            self._status_cache = (0.0, None)
+            self._edge_cache.clear()
+            self._length_cache.clear()
+            self._log("Disconnected")
 
     def reset_handle(self, address: Optional[str] = None) -> bool:
         """Close and reopen the gclib handle without going through a full disconnect/reconnect.
@@ -248,7 +430,7 @@ class GalilController:
             self._connected = True
             # Re-issue CW2,1 after handle reset (see connect() for rationale).
             try:
-                self._driver.GCommand("CW2,1")
+                self._gcommand("CW2,1")
             except Exception:
                 pass
             return True
@@ -262,40 +444,71 @@ class GalilController:
         """Return True if the controller handle is currently open."""
         return self._connected
 
-    def read_status(self) -> Dict[str, Any]:
-        """Read controller status including position and speed information."""
+    def read_status(self, ttl_ms: float = STATUS_TTL_MS) -> Dict[str, Any]:
+        """Read controller status including position and speed information.
+
+        Positions A-D and speed come back from a single STATUS_CMD round-trip;
+        if that reply cannot be parsed, each value is read separately.
+
+        A result fetched less than *ttl_ms* ago is returned again (as a fresh
+        copy) so several pollers in one frame share one round-trip. Pass
+        ``ttl_ms=0`` when the reading must be current.
+        """
         if not self._driver or not self._connected:
             raise RuntimeError("No controller connected")
 
-        try:
-            # Read position for all axes (reduced debug output)
-            pos = {}
-            for axis in ['A', 'B', 'C', 'D']:
-                try:
-                    resp = self.cmd(f"MG _TP{axis}")
-                    pos[axis] = float(resp.strip())
-                except Exception:
-                    pos[axis] = 0.0
+        ts, cached = self._status_cache
+        if cached is not None and (time.monotonic() - ts) * 1000.0 < ttl_ms:
+            return {"pos": dict(cached["pos"]), "speeds": cached["speeds"]}
 
-            # Read speed (using _TSA as an example - adjust based on your controller setup)
+        try:
+            # One round-trip for all four positions plus speed
             try:
-                speed_resp = self.cmd("MG _TSA")
-                speed = float(speed_resp.strip())
+                nums = _parse_floats(self.cmd(STATUS_CMD))
             except Exception:
-                speed = 0.0
+                nums = []
+            if len(nums) == 5:
+                a, b, c, d, speed = nums
+                pos = {"A": a, "B": b, "C": c, "D": d}
+            else:
+                pos, speed = self._read_status_per_field()
 
-            return {
-                "pos": pos,
-                "speeds": speed
-            }
+            # Stamp after the reply so the TTL counts from when data arrived
+            self._status_cache = (time.monotonic(), {"pos": pos, "speeds": speed})
+            return {"pos": dict(pos), "speeds": speed}
         except Exception as e:
-            if self._logger:
-                try:
-                    self._logger(f"Status read error: {e}")
-                except Exception:
-                    pass
+            self._log(f"Status read error: {e}")
             raise RuntimeError(f"Failed to read status: {e}")
 
+    def teach_point(self, name: str) -> Dict[str, float]:
+        """Return the current A-D positions to record as taught point *name*.
+
+        Shares read_status's cache: a status fetched within STATUS_TTL_MS is
+        reused, otherwise the fused STATUS_CMD is sent, which also warms the
+        cache for the next poller.
+        """
+        pos = self.read_status()["pos"]
+        logger.debug("teach_point %s: %s", name, pos)
+        return pos
+
+    def _read_status_per_field(self) -> tuple[Dict[str, float], float]:
+        """Fallback for read_status: one MG per value, 0.0 for any failed read."""
+        pos = {}
+        for axis, tp_cmd in _TP_CMDS:
+            try:
+                resp = self.cmd(tp_cmd)
+                pos[axis] = float(resp.strip())
+            except Exception:
+                pos[axis] = 0.0
+
+        # Read speed (using _TSA as an example - adjust based on your controller setup)
+        try:
+            speed_resp = self.cmd(_TS_CMD)
+            speed = float(speed_resp.strip())
+        except Exception:
+            speed = 0.0
+        return pos, speed
+
     # Used to input commands to the controller, ESTOP uses this
     def cmd(self, command: str) -> str:
         """Send a DMC command and return the response string.
@@ -303,7 +516,7 @@ class GalilController:
         Status-polling commands (MG _TP*, MG hmi*, etc.) are not logged to
         avoid flooding the log at 10 Hz. All other commands are logged at DEBUG.
         On error, attempts ``TC1`` to retrieve the controller error code before
-        raising RuntimeError.
+        raising RuntimeError (see _error_text).
 
         Args:
             command: DMC command string (e.g. ``"MG _TPA"`` or ``"ST ABCD"``).
@@ -316,75 +529,88 @@ class GalilController:
         """
         if not self._driver or not self._connected:
             # Surface a clear message to UI when called while disconnected
-            if self._logger:
-                try:
-                    self._logger("No controller connected")
-                except Exception:
-                    pass
+            self._log("No controller connected")
             raise RuntimeError("No controller connected")
         try:
             # Completely suppress debug output for status polling commands
             # Also suppress poller-frequency MG commands to avoid 10 Hz log flood
-            is_status_command = (command.startswith("MG _TP") or command.startswith("MG _TS")
-                                 or command.startswith("MG hmi") or command.startswith("MG ct")
-                                 or command.startswith("MG _XQ")
-                                 or command.startswith("MG aPos") or command.startswith("MG bPos")
-                                 or command.startswith("MG cPos") or command.startswith("MG dPos"))
+            is_status_command = command.startswith(_QUIET_CMD_PREFIXES)
             if not is_status_command:
                 logger.debug("Sending command: %s", command)
-            resp = self._driver.GCommand(command)
+            resp = self._gcommand(command)
+            self._tc1_cache = _NO_TC1  # a success ends any failure burst
             if not is_status_command:
                 logger.debug("Response: %s", resp.strip())
-                if self._logger:
-                    try:
-                        self._logger(f"CMD {command} -> {resp.strip()}")
-                    except Exception:
-                        pass
+                self._log(f"CMD {command} -> {resp.strip()}")
             return resp
         except Exception as e:
             logger.warning("Command failed: %s -> %s", command, e)
-            # Try to fetch error string
-            try:
-                tc1 = self._driver.GCommand("TC1")
-                logger.warning("TC1 error code: %s", tc1)
-            except Exception:
-                tc1 = str(e)
-                logger.warning("Could not get TC1: %s", tc1)
-            if self._logger:
-                try:
-                    self._logger(f"Error: {tc1}")
-                except Exception:
-                    pass
+            tc1 = self._error_text(command, e)
+            self._log(f"Error: {tc1}")
             raise RuntimeError(tc1)
 
+    def _error_text(self, command: str, err: Exception) -> str:
+        """Return the controller's TC1 error text for failed *command*.
+
+        When the same command fails again less than TC1_TTL_S after the
+        last TC1, with no successful cmd() in between, that reply is reused,
+        so a retry burst on a faulted or degraded link costs one extra
+        round-trip, not one per failure. A different command always gets a
+        fresh TC1: its error code decides e.g. "array not declared". Falls
+        back to *err* if TC1 itself fails.
+        """
+        ts, failed, tc1 = self._tc1_cache
+        if tc1 and failed == command and time.monotonic() - ts < TC1_TTL_S:
+            return tc1
+        try:
+            tc1 = self._gcommand(_TC1_CMD)
+            logger.warning("TC1 error code: %s", tc1)
+        except Exception:
+            tc1 = str(err)
+            logger.warning("Could not get TC1: %s", tc1)
+            return tc1
+        self._tc1_cache = (time.monotonic(), command, tc1)
+        return tc1
+
+    def _tc1_now(self) -> str:
+        """Ask TC1 for the current error, bypassing _error_text's cache ("" on failure)."""
+        try:
+            return self._gcommand(_TC1_CMD)
+        except Exception:
+            return ""
+
 # used to determine if a working connection exists at startup
     def verify_connection(self) -> bool:
         """Try a benign command to determine if a working connection exists.
 
-        If successful, marks controller as connected.
+        If successful, marks controller as connected. A success is reused for
+        VERIFY_TTL_S so back-to-back checks cost one round-trip.
         """
         if not self._driver:
             return False
-        try:
-            _ = self._driver.GCommand("MG{Z10.0} _SPA")
-            self._connected = True
-            if self._logger:
-                try:
-                    self._logger("Verified existing connection")
-                except Exception:
-                    pass
+        now = time.monotonic()
+        if self._connected and now - self._verify_ts < VERIFY_TTL_S:
             return True
+        try:
+            self._gcommand(VERIFY_CMD)
         except Exception:
             self._connected = False
+            self._verify_ts = 0.0
             return False
+        self._connected = True
+        self._verify_ts = now
+        self._log("Verified existing connection")
+        return True
 
 
     #used to get the array from controller to the GUI
     def upload_array(self, name: str, first: int, last: int) -> List[float]:
         """Read controller array *name*[first..last] as a list of floats.
 
-        Prefers gclib GArrayUpload when available; falls back to chunked MG reads
-        with adaptive chunk-size reduction on parse errors.
+        Prefers gclib GArrayUpload when available; falls back to a single QU
+        bulk upload (skipped until the next connect once the firmware has
+        refused it), then to MG reads packed up to CMD_LINE_MAX characters
+        per line with chunk-size halving on parse errors.
 
         Args:
             name: Controller array variable name (e.g. ``"EdgeB"``).
@@ -408,71 +634,109 @@ class GalilController:
                       self._driver is not None, self._connected)
             raise RuntimeError("No controller connected")
 
-        # Prefer GArrayUpload if available on the driver
-        if hasattr(self._driver, "GArrayUpload"):
+        count = last - first + 1
+
+        # Prefer GArrayUpload (one transfer for the whole range) if available
+        values = self._try_array_upload(name, first, last)
+        if values is not None:
+            return values
+
+        # Fallback 1: one QU (bulk array upload) round-trip for the whole range.
+        # Sent on the raw handle: firmware without QU refuses it, which must
+        # not cost a TC1 query and a UI error line on every read.
+        qu_tried = not self._qu_unavailable
+        if qu_tried:
             try:
-                text = getattr(self._driver, "GArrayUpload")(name, first, last, 1)
-                normalized = str(text).replace("\r", " ").replace("\n", " ")
-                tokens = [tok.strip() for tok in normalized.split(",") if tok.strip()]
-                return [float(tok) for tok in tokens][: (last - first + 1)]
+                values = _parse_floats(self._gcommand(f"QU {name}[],{first},{last},1"))
+                if len(values) >= count:
+                    return values[:count]
             except Exception:
-                # Fall through to MG-based approach
                 pass
 
-        # Fallback: use MG in safe chunks with adaptive sizing
+        # Fallback 2: MG reads packed into full command lines
         logger.debug("upload_array: using MG fallback method for %s[%d:%d]", name, first, last)
-        out: List[float] = []
-        i = first
-        chunk_size = 1  # Start with 1 element at a time
+        result = self._mg_read_range(name, first, last)
+        if qu_tried:
+            # MG could read the array QU could not: QU itself is unsupported,
+            # so skip it until the next connect (a missing array raises above)
+            self._qu_unavailable = True
+        logger.debug("upload_array: returning %d values from %s", len(result), name)
+        return result
 
-        while i <= last:
-            count = min(chunk_size, last - i + 1)
-            refs = ", ".join(f"{name}[{j}]" for j in range(i, i + count))
-            cmd = "MG " + refs
+    def _try_array_upload(self, name: str, first: int, last: int) -> Optional[List[float]]:
+        """Read name[first..last] in one GArrayUpload transfer, or None if unavailable.
 
+        gclib.py takes (name, first, last) and returns a list of floats; some
+        wrappers want a trailing delimiter flag and return text. Returns None
+        when the driver has no GArrayUpload or the call fails, so callers can
+        fall back to MG reads.
+        """
+        fn = self._array_upload
+        if fn is None:
+            return None
+        count = last - first + 1
+        try:
             try:
-                resp = self.cmd(cmd).strip()
+                data = fn(name, first, last)
+            except TypeError:
+                data = fn(name, first, last, 1)
+            if isinstance(data, list):
+                return [float(v) for v in data[:count]]
+            return parse_number_list(str(data), count)
+        except Exception:
+            return None
 
-                if resp == "?":
-                    logger.warning("upload_array: got '?' response — array %s not available", name)
-                    raise ControllerNotReadyError(f"Array {name} not available")
+    def _mg_read_range(self, name: str, first: int, last: int) -> List[float]:
+        """Read name[first..last] with MG lines packed up to CMD_LINE_MAX characters.
 
-                parts = resp.replace("\r", " ").replace("\n", " ").split()
-                out.extend(float(p) for p in parts)
-                i += count
+        Each line is one round-trip carrying as many ``name[i]`` operands as
+        fit; the chunk is halved only when the controller rejects a line.
 
-                # If successful with current chunk size, try to increase it for efficiency
-                if chunk_size == 1 and count == 1:
-                    chunk_size = 2  # Try 2 elements next time
+        Raises:
+            ControllerNotReadyError: If the controller answers ``?`` (array
+                not declared or index out of its range).
+        """
+        out: List[float] = []
+        i = first
+        width = len(f"{name}[{last}],")
+        chunk_size = max(1, (CMD_LINE_MAX - 3) // width)
 
-                # Small delay to avoid overwhelming the controller
-                import time
-                time.sleep(0.01)  # 10ms delay
+        while i <= last:
+            n = min(chunk_size, last - i + 1)
+            cmd = "MG " + _array_refs(name, i, i + n)
 
+            try:
+                resp = self.cmd(cmd).strip()
             except Exception as e:
-                if "question mark" in str(e).lower():
-                    # Reduce chunk size and retry
-                    if chunk_size > 1:
-                        chunk_size = max(1, chunk_size // 2)
-                        logger.debug("upload_array: reducing chunk size to %d due to error", chunk_size)
-                        continue
-                    else:
-                        # Even 1 element failed, this is a real error
-                        raise e
-                else:
-                    raise e
+                if "question mark" in str(e).lower() and chunk_size > 1:
+                    chunk_size = max(1, chunk_size // 2)
+                    logger.debug("_mg_read_range: reducing chunk size to %d due to error", chunk_size)
+                    continue
+                raise
 
-        result = out[: (last - first + 1)]
-        logger.debug("upload_array: returning %d values from %s", len(result), name)
-        return result
+            try:
+                out.extend(_parse_floats(resp))
+            except ValueError:
+                if "?" not in resp:
+                    raise
+                logger.warning("_mg_read_range: got '?' response — array %s not available", name)
+                raise ControllerNotReadyError(f"Array {name} not available")
+            i += n
+
+        return out[:last - first + 1]
 
     #used to get the array from GUI to controller
     def download_array(self, name: str, first: int, values: Sequence[float]) -> int:
         """Write Python values into controller array *name* starting at index *first*.
 
-        Attempts GArrayDownload (three calling conventions) before falling back to
-        chunked ``name[idx]=value`` assignments via GCommand. Each chunk is kept
-        under 300 characters to fit within DMC parser limits.
+        Uses GArrayDownload when the driver has it, otherwise chunked
+        ``name[idx]=value`` assignments via GCommand, each line kept under
+        CMD_LINE_MAX characters to fit within DMC parser limits.
+
+        Which GArrayDownload calling convention the wrapper accepts is
+        detected on the first write and cached per driver, so later writes
+        make a single call. Only signature mismatches (TypeError) move on to
+        the next convention; controller errors propagate to the caller.
 
         Args:
             name: Controller array variable name (e.g. ``"deltaC"``).
@@ -489,73 +753,132 @@ class GalilController:
             return 0
         if not self._driver or not self._connected:
             raise RuntimeError("No controller connected")
+        self._forget_array(name)
 
         n = len(values)
         last = first + n - 1
-
-        # --- Fast path: try GArrayDownload on the driver ----------------------
-        fn = getattr(self._driver, "GArrayDownload", None)
-        if callable(fn):
-            ascii_payload = ",".join(str(v) for v in values)
-            # Try common Python wrapper variants in order:
-            #  - Some wrappers accept ASCII directly: (name, first, last, ascii_payload)
-            #  - Some accept a delimiter flag too:     (name, first, last, 1, ascii_payload)
-            #  - Some want raw binary doubles buffer:  (name, first, last, bytes)
-            # We attempt these patterns; if all fail, we fall back to GCommand.
+        fn = self._array_download
+        mode = self._download_mode
+        if mode is None:
+            mode = _DOWNLOAD_MODES[0] if fn is not None else "cmd"
+
+        # Wrapper variants, tried in _DOWNLOAD_MODES order:
+        #  - "list": gclib.py takes a list of values: (name, first, last, [v, ...])
+        #    (it joins them itself; passing a string would be iterated
+        #    character by character). Lists and tuples are passed through
+        #    as-is: the wrapper only iterates them, so no copy is needed.
+        #  - "ascii_delim": ASCII with a delimiter flag: (name, first, last, 1, payload)
+        #  - "cmd": no usable GArrayDownload, send assignments via GCommand
+        while mode != "cmd":
             try:
-                fn(name, first, last, ascii_payload)  # ASCII, no delimiter arg
-                return n
-            except Exception:
-                try:
-                    fn(name, first, last, 1, ascii_payload)  # ASCII with delimiter flag
-                    return n
-                except Exception:
-                    try:
-                        import struct
-                        buf = struct.pack("<" + "d" * n, *values)  # little-endian doubles
-                        fn(name, first, last, buf)  # binary buffer
-                        return n
-                    except Exception:
-                        pass  # fall through to MG-based approach
-
-        # --- Fallback: send assignments via GCommand in safe chunks ----------
+                if mode == "list":
+                    fn(name, first, last,
+                       values if isinstance(values, (list, tuple)) else list(values))
+                else:
+                    fn(name, first, last, 1, ",".join(map(str, values)))
+            except TypeError:
+                if self._download_mode is not None:
+                    raise
+                mode = _DOWNLOAD_MODES[_DOWNLOAD_MODES.index(mode) + 1]
+                continue
+            self._download_mode = mode
+            return n
+        self._download_mode = mode
+
         # Build assignments like:  Arr[0]=1.23;Arr[1]=4.56;...
-        written = 0
-        line = ""
-        for i, v in enumerate(values):
-            cmd = f"{name}[{first + i}]={v}"
-            # keep command lines comfortably short for the DMC parser
-            if len(line) + len(cmd) + 1 < 300:
-                line = f"{line};{cmd}" if line else cmd
-            else:
-                self.cmd(line)
-                written += line.count("=")  # number of assignments we just sent
-                line = cmd
-        if line:
-            self.cmd(line)
-            written += line.count("=")
-        return written
-
-    def wait_for_ready(self, *, timeout_s: float = 5.0, poll_s: float = 0.1) -> None:
+        self.cmd_batch([f"{name}[{first + i}]={v}" for i, v in enumerate(values)])
+        return n
+
+    def write_array(self, name: str, updates: Dict[int, float]) -> int:
+        """Write *updates* ({index: value}) into controller array *name*.
+
+        A contiguous run of indices (e.g. a whole-array write) goes through
+        download_array, i.e. one GArrayDownload transfer. Sparse updates are
+        sent as assignments in index order, packed into as few command lines
+        as the DMC parser allows.
+
+        Returns:
+            Number of elements written.
+        """
+        self._forget_array(name)
+        items = sorted(updates.items())
+        if len(items) > 1 and items[-1][0] - items[0][0] + 1 == len(items):
+            return self.download_array(name, items[0][0], [val for _, val in items])
+        self.cmd_batch([f"{name}[{idx}]={val}" for idx, val in items])
+        return len(items)
+
+    def cmd_batch(self, cmds: Iterable[str], line_max: int = CMD_LINE_MAX) -> str:
+        """Send *cmds* joined by ``;``, each line kept under *line_max* characters.
+
+        Each line is one GCommand round-trip, so K short commands cost
+        roughly ``total_len / line_max`` round-trips instead of K.
+
+        Args:
+            cmds: DMC statements, e.g. ``"arr[3]=1.5"``.
+            line_max: Line length limit; a caller that must keep its writes'
+                original, shorter lines passes it explicitly.
+
+        Returns:
+            The non-empty replies of each line, joined by newlines.
+        """
+        replies: List[str] = []
+        buf: List[str] = []
+        size = 0  # len(";".join(buf))
+        for cmd in cmds:
+            if buf and size + len(cmd) + 1 >= line_max:
+                replies.append(self.cmd(";".join(buf)))
+                buf.clear()
+                size = 0
+            size += len(cmd) + (1 if buf else 0)
+            buf.append(cmd)
+        if buf:
+            replies.append(self.cmd(";".join(buf)))
+        return "\n".join(r for r in replies if r)
+
+    def wait_for_ready(
+        self, *, timeout_s: float = 5.0, poll_s: float = 0.1, arrays: Sequence[str] = (),
+        min_poll_s: float = 0.001,
+    ) -> None:
         """Wait until controller is responsive.
 
-        1) Probe a cheap numeric like _TPA
-        2) Optionally check for arrays if they exist
+        Each poll is one compound MG: _TPA plus ``name[0]`` for every array in
+        *arrays*, so readiness of the axes and the arrays about to be read is
+        checked in a single round-trip. Probes go straight to GCommand,
+        skipping cmd()'s logging.
+
+        If the probe is rejected and a fresh TC1 reports error 57 (an array
+        in *arrays* is not declared), the controller is answering, so this
+        returns at once; callers then see the missing array as they would
+        without the probe (e.g. discover_length returns 0).
+
+        Failed probes back off exponentially from *min_poll_s* up to
+        *poll_s*, so a controller that becomes ready quickly is seen within
+        milliseconds while a slow one is still only polled every *poll_s*.
+        Raise *min_poll_s* on slow links to space out the early retries.
         """
         self.ensure_connected()
+        probe = "MG _TPA" + "".join(f", {name}[0]" for name in arrays)
+        expected = 1 + len(arrays)
         end = (time.monotonic() + timeout_s)
         last_err: Optional[Exception] = None
+        attempt = 0
         logger.info("Waiting for controller ready...")
         while time.monotonic() < end:
             try:
-                _ = self._parse_float_str(self.cmd("MG _TPA"))
+                vals = parse_number_list(self._gcommand(probe))
+                if len(vals) != expected:
+                    raise ValueError(f"expected {expected} values from {probe!r}, got {len(vals)}")
                 logger.info("Ready: controller responding")
                 return
 
             except Exception as e:
+                if arrays and not isinstance(e, ValueError) and _is_undeclared_array(self._tc1_now()):
+                    logger.info("Ready: controller responding (array not declared: %s)", ", ".join(arrays))
+                    return
                 last_err = e
                 logger.debug("Controller not ready: %s", e)
-            time.sleep(poll_s)
+            time.sleep(_poll_delay(attempt, min_poll_s, poll_s))
+            attempt += 1
         raise ControllerNotReadyError(f"Controller not ready within {timeout_s}s: {last_err}")
 
     def test_basic_connectivity(self) -> bool:
@@ -571,8 +894,8 @@ class GalilController:
     def _parse_float_str(self, s: str) -> float:
         """Parse the first numeric token from a controller response string.
 
-        Tries direct float() conversion first, then splits on commas/spaces and
-        validates each token against FLOAT_CHARS before converting.
+        Tries direct float() conversion first (the common single-value reply),
+        then returns the first comma/space separated token float() accepts.
 
         Args:
             s: Raw response string from GCommand (may have trailing whitespace or commas).
@@ -593,17 +916,13 @@ class GalilController:
         except ValueError:
             pass
 
-        # Fall back to parsing comma/space separated values and take first
-        try:
-            # Split on common delimiters and take first numeric value
-            parts = t.replace(',', ' ').split()
-            for part in parts:
-                part = part.strip()
-                if part and all(ch in FLOAT_CHARS for ch in part):
-                    return float(part)
-            raise ValueError("no numeric values found")
-        except Exception as e:
-            raise ParseError(f"Parse error for '{s}': {e}")
+        # Fall back to the first numeric token of a multi-value reply
+        for part in _split_tokens(t):
+            try:
+                return float(part)
+            except ValueError:
+                continue
+        raise ParseError(f"Parse error for '{s}': no numeric values found")
 
     # ===================== Robust Edge array APIs =====================
     def set_max_edges(self, n: int) -> None:
@@ -674,11 +993,16 @@ class GalilController:
             raise IndexOutOfRangeError("start/count must be non-negative and count>0")
         if start + count > self._max_edges:
             raise IndexOutOfRangeError(f"slice {start}+{count} exceeds max {self._max_edges}")
-        out: List[float] = []
         logger.debug("Reading slice %s[%d:%d]", var_name, start, start + count)
-        for i in range(start, start + count):
-            out.append(self.read_array_elem(var_name, i))
-        return out
+        values = self._try_array_upload(var_name, start, start + count - 1)
+        if values is not None and len(values) == count:
+            return values
+        try:
+            return self._mg_read_range(var_name, start, start + count - 1)
+        except RuntimeError as e:
+            if "Bad function or array" in str(e) or "57" in str(e):
+                raise ControllerNotReadyError(f"Array {var_name} is not declared on the controller")
+            raise
 
     def read_edge_b(self, idx: int) -> float:
         """Read EdgeB[idx] (B-axis segment boundary position in counts).
@@ -702,71 +1026,147 @@ class GalilController:
         """
         return self.read_array_elem("EdgeC", idx)
 
-    def discover_length(self, var_name: str, probe_max: Optional[int] = None, zero_run: int = 5) -> int:
+    def discover_length(
+        self, var_name: str, probe_max: Optional[int] = None, zero_run: int = 5, ttl_s: float = 0.0
+    ) -> int:
         """Probe an array to discover how many elements contain non-zero data.
 
-        Reads indices sequentially until *zero_run* consecutive near-zero values
-        are found, then returns last_nonzero + 1. Stops at min(_max_edges, probe_max).
+        Scans until *zero_run* consecutive near-zero values are found, then
+        returns last_nonzero + 1. Stops at min(_max_edges, probe_max). The
+        window is fetched in one GArrayUpload when the driver supports it,
+        otherwise in packed MG lines, stopping at the first zero run.
+
+        A result for the same array, bound and *zero_run* found less than
+        *ttl_s* ago is returned without probing; writes to the array through
+        this controller and disconnect() drop it.
 
         Args:
             var_name: Array name to probe.
             probe_max: Optional upper bound (defaults to _max_edges).
             zero_run: Number of consecutive near-zero values that signals end-of-data.
+            ttl_s: Maximum age in seconds of a cached result (0: always probe).
 
         Returns:
             Estimated number of populated elements (0 if all zeros).
         """
         self.ensure_connected()
         limit = min(self._max_edges, probe_max or self._max_edges)
-        last_nonzero = -1
-        zeros = 0
-        for i in range(0, limit):
-            try:
-                val = self.read_array_elem(var_name, i)
-            except ControllerNotReadyError:
-                break
-            if abs(val) < 1e-9:
-                zeros += 1
-                if zeros >= zero_run and i > 0:
-                    logger.debug("discover_length: hit %d zeros at index %d", zero_run, i)
-                    break
-            else:
-                last_nonzero = i
-                zeros = 0
-        length = max(0, last_nonzero + 1)
+        hit = self._length_cache.get(var_name)
+        if (hit is not None and hit[1:3] == (limit, zero_run)
+                and time.monotonic() - hit[0] < ttl_s):
+            return hit[3]
+        length = self._probe_length(var_name, limit, zero_run)
+        self._length_cache[var_name] = (time.monotonic(), limit, zero_run, length)
+        return length
+
+    def _probe_length(self, var_name: str, limit: int, zero_run: int) -> int:
+        """discover_length's uncached probe of name[0..limit-1]."""
+        values = self._try_array_upload(var_name, 0, limit - 1)
+        if values is not None:
+            # Whole window in one transfer; find the zero run in Python
+            length = _populated_length(values, zero_run)
+            logger.debug("discover_length(%s) -> %d (bulk)", var_name, length)
+            return length
+        # No block upload: clamp to the DM'd size (one MG), then read packed
+        # MG lines lazily so the scan stops fetching once the zero run shows
+        try:
+            limit = min(limit, self.get_array_len(var_name))
+        except Exception as e:
+            logger.debug("discover_length: %s has no readable length: %s", var_name, e)
+            return 0
+        per_line = max(1, (CMD_LINE_MAX - 3) // len(f"{var_name}[{limit}],"))
+
+        def values_lazy() -> Iterable[float]:
+            for start in range(0, limit, per_line):
+                try:
+                    chunk = self._mg_read_range(var_name, start, min(limit, start + per_line) - 1)
+                except ControllerNotReadyError:
+                    return
+                except RuntimeError as e:
+                    # Same "not declared" mapping as read_array_elem: end the scan
+                    if "Bad function or array" in str(e) or "57" in str(e):
+                        return
+                    raise
+                yield from chunk
+
+        length = _populated_length(values_lazy(), zero_run)
         logger.debug("discover_length(%s) -> %d", var_name, length)
         return length
 
-    def get_edges_window(self, var_name: str, start: int, count: int) -> List[float]:
+    def _forget_array(self, name: str) -> None:
+        """Drop cached slices and length of *name* (it is being written)."""
+        self._edge_cache.pop(name, None)
+        self._length_cache.pop(name, None)
+
+    def _cached_edges(self, var_name: str, start: int, count: int, ttl_s: float) -> Optional[List[float]]:
+        """Return name[start:start+count] from the edge cache, or None if stale/missing."""
+        entry = self._edge_cache.get(var_name)
+        if entry is None:
+            return None
+        ts, first, vals = entry
+        if time.monotonic() - ts >= ttl_s or start < first or start + count > first + len(vals):
+            return None
+        return vals[start - first:start - first + count]
+
+    def get_edges_window(
+        self, var_name: str, start: int, count: int, ttl_s: float = 0.0
+    ) -> List[float]:
         """Wait for controller ready, then return a slice of an edge array.
 
+        With *ttl_s* > 0, a slice inside one read less than *ttl_s* ago is
+        returned from memory with no controller traffic. download_array/
+        write_array on the same array and disconnect() drop the cached copy,
+        but cmd()/cmd_batch() writes and the controller program do not, so
+        only opt in where nothing else rewrites the array meanwhile.
+
         Args:
             var_name: Edge array name (e.g. ``"EdgeB"``).
             start: First index.
             count: Number of elements to read.
+            ttl_s: Maximum age in seconds of a cached slice (0: always read).
 
         Returns:
             List of float values.
         """
-        self.wait_for_ready()
-        return self.read_array_slice(var_name, start, count)
-
-    def get_edges_default_window(self, var_name: str = "EdgeB", preferred: int = 10) -> List[float]:
+        cached = self._cached_edges(var_name, start, count, ttl_s)
+        if cached is not None:
+            return cached
+        self.wait_for_ready(arrays=(var_name,))
+        vals = self.read_array_slice(var_name, start, count)
+        self._edge_cache[var_name] = (time.monotonic(), start, vals)
+        return list(vals)
+
+    def get_edges_default_window(
+        self, var_name: str = "EdgeB", preferred: int = 10, ttl_s: float = 0.0
+    ) -> List[float]:
         """Wait for ready, discover array length, and return up to *preferred* elements.
 
+        Shares get_edges_window's opt-in cache: if *preferred* elements were
+        read less than *ttl_s* ago, they are returned with no controller traffic.
+        Otherwise the call waits for ready, then runs discover_length (its
+        result reused for *ttl_s*) and reads the slice unless it is cached.
+
         Args:
             var_name: Edge array name (defaults to ``"EdgeB"``).
             preferred: Maximum number of elements to return.
+            ttl_s: Maximum age in seconds of a cached slice (0: always read).
 
         Returns:
             List of floats, empty if array has no non-zero data.
         """
-        self.wait_for_ready()
-        n = self.discover_length(var_name)
+        cached = self._cached_edges(var_name, 0, preferred, ttl_s)
+        if cached is not None:
+            return cached
+        self.wait_for_ready(arrays=(var_name,))
+        n = self.discover_length(var_name, ttl_s=ttl_s)
         if n == 0:
             return []
         count = min(preferred, n)
-        return self.read_array_slice(var_name, 0, count)
+        vals = self._cached_edges(var_name, 0, count, ttl_s)
+        if vals is None:
+            vals = self.read_array_slice(var_name, 0, count)
+            self._edge_cache[var_name] = (time.monotonic(), 0, vals)
+        return list(vals)
 
     def diagnose_controller_state(self) -> None:
         """Log a diagnostic snapshot of controller state and available arrays.
@@ -826,7 +1226,7 @@ class GalilController:
         """
         if not self._driver or not self._connected:
             raise RuntimeError("No controller connected")
-        raw = self._driver.GCommand(f"MG {name}[-1]").strip()
+        raw = self._gcommand(f"MG {name}[-1]").strip()
         # MG returns a float-formatted string (e.g., "150.0000")
         try:
             return int(float(raw))
@@ -852,16 +1252,14 @@ class GalilController:
             raise RuntimeError("No controller connected")
 
         # Fast path: try GArrayUpload(name, -1, -1) if wrapper supports it
-        fn = getattr(self._driver, "GArrayUpload", None)
-        if callable(fn):
+        fn = self._array_upload
+        if fn is not None:
             try:
                 # Some wrappers return a list already; others return a CSV/text
                 data = fn(name, -1, -1)
                 if isinstance(data, list):
                     return [float(x) for x in data]
-                text = str(data).replace("\r", " ").replace("\n", " ")
-                toks = [t for t in (tok.strip() for tok in text.split(",")) if t]
-                return [float(t) for t in toks]
+                return [float(t) for t in _split_tokens(str(data))]
             except Exception:
                 pass  # fall back to length+MG
 
@@ -874,8 +1272,8 @@ class GalilController:
     def download_array_full(self, name: str, values: Sequence[float]) -> int:
         """Write *values* into name[0..len(values)-1] without passing explicit indices.
 
-        Convenience wrapper over download_array. Tries GArrayDownload first
-        (three calling conventions), then falls back to chunked GCommand writes.
+        Convenience wrapper over download_array (GArrayDownload first, then
+        chunked GCommand writes).
 
         Args:
             name: Controller array variable name.
@@ -889,31 +1287,7 @@ class GalilController:
         """
         if not self._driver or not self._connected:
             raise RuntimeError("No controller connected")
-        if not values:
-            return 0
-
-        # Prefer native GArrayDownload if available
-        fn = getattr(self._driver, "GArrayDownload", None)
-        if callable(fn):
-            ascii_payload = ",".join(str(v) for v in values)
-            try:
-                fn(name, ascii_payload)                 # (name, data)
-                return len(values)
-            except Exception:
-                try:
-                    fn(name, 0, len(values) - 1, 1, ascii_payload)  # (name, first,last,delim,data)
-                    return len(values)
-                except Exception:
-                    try:
-                        import struct
-                        buf = struct.pack("<" + "d"*len(values), *values)
-                        fn(name, 0, len(values) - 1, buf)  # (name, first,last,bytes)
-                        return len(values)
-                    except Exception:
-                        pass  # fall through to command-assignments
-
-        # Fallback: chunked assignments via command line
-        return self.download_array(name, 0, values)  # reuse your existing writer
+        return self.download_array(name, 0, values)
 
 if __name__ == "__main__":  # Minimal integration demo
     import os
@@ -934,22 +1308,3 @@ if __name__ == "__main__":  # Minimal integration demo
                 print("EdgeC[0:10]", window_c)
             finally:
                 c.disconnect()
-
-    def write_array(self, name: str, updates: dict[int, float]) -> int:
-        # Chunk to approximately 300 chars per command line
-        items = sorted((idx, val) for idx, val in updates.items())
-        line = ""
-        written = 0
-        for idx, val in items:
-            cmd = f"{name}[{idx}]={val}"
-            # keep command lines comfortably short for the DMC parser
-            if len(line) + len(cmd) + 1 < 300:
-                line = f"{line};{cmd}" if line else cmd
-            else:
-                self.cmd(line)
-                written += line.count("=")  # number of assignments we just sent
-                line = cmd
-        if line:
-            self.cmd(line)
-            written += line.count("=")
-        return written
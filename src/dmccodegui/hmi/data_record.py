@@ -30,7 +30,9 @@ Threading model
 ---------------
 - ``start()`` sends IH + DR commands over TCP (one-shot, via controller.cmd)
 - Background thread blocks on ``socket.recv()`` with 4 s timeout
-- Parsed values are posted to the Kivy main thread via ``Clock.schedule_once``
+- Parsed values overwrite a single latest-snapshot slot (under a lock) and
+  fire a ``Clock.create_trigger``; the main thread applies only the newest
+  snapshot, at most once per frame
 - ``_apply_to_state()`` runs on main thread — the ONLY place that writes MachineState
 - ``stop()`` sends DR 0 + IH close over TCP, then joins the thread
 
@@ -215,6 +217,11 @@ class DataRecordListener:
         # Track state for grind-end detection
         self._prev_dmc_state: int = 0
 
+        # Latest parsed packet, consumed by _apply_latest on the main thread
+        self._latest: Optional[tuple] = None
+        self._latest_lock = threading.Lock()
+        self._apply_trigger = Clock.create_trigger(self._apply_latest)
+
     # ------------------------------------------------------------------
     # Public lifecycle
     # ------------------------------------------------------------------
@@ -413,13 +420,19 @@ class DataRecordListener:
         # Check for adaptive rate change
         self._check_rate_change(dmc_state)
 
-        # Post to main thread
-        Clock.schedule_once(
-            lambda _dt: self._apply_to_state(
-                a, b, c, d, dmc_state, ses_kni, stn_kni,
-                start_pt_c, program_running
-            )
-        )
+        # Publish to the main thread; packets arriving before the next frame
+        # replace the pending snapshot instead of queueing more callbacks
+        with self._latest_lock:
+            self._latest = (a, b, c, d, dmc_state, ses_kni, stn_kni,
+                            start_pt_c, program_running)
+        self._apply_trigger()
+
+    def _apply_latest(self, _dt: float) -> None:
+        """Main thread trigger: apply the newest pending snapshot, if any."""
+        with self._latest_lock:
+            snapshot, self._latest = self._latest, None
+        if snapshot is not None:
+            self._apply_to_state(*snapshot)
 
     def _apply_to_state(
         self,
@@ -14,6 +14,7 @@ import logging
 import logging.handlers
 import os
 import traceback
+from collections import deque
 
 
 def _get_data_dir() -> str:
@@ -502,19 +503,25 @@ class DMCApp(App):
 
         # State streaming handled by DataRecordListener (started when controller connects)
 
-        # Hook controller logger to push messages into state and show banner
-        self.controller.set_logger(lambda msg: Clock.schedule_once(lambda *_: self._log_message(msg)))
-
-        # Detect pre-existing connection (e.g., controller opened by previous run)
-        if self.controller.verify_connection():
-            self.state.set_connected(True)
-            self._start_dr()
-            self._start_mg_reader()
-            self._preload_params()
-            # Connection present — show machine type picker first if not configured,
-            # then PIN overlay. Use callback chaining to guarantee order.
-            Clock.schedule_once(lambda *_: self._show_startup_flow(), 0)
-        else:
+        # Hook controller logger to push messages into state and show banner.
+        # The jobs thread only appends; one trigger drains the backlog per frame.
+        self._ctrl_msgs: deque[str] = deque(maxlen=256)
+        self._ctrl_msgs_trigger = Clock.create_trigger(self._drain_ctrl_msgs)
+        self.controller.set_logger(self._queue_ctrl_msg)
+
+        # Detect pre-existing connection (e.g., controller opened by previous run).
+        # The probe is a controller round-trip, so it runs on the jobs thread and
+        # the result is applied on the main thread.
+        def _on_probe(present: bool) -> None:
+            if present:
+                self.state.set_connected(True)
+                self._start_dr()
+                self._start_mg_reader()
+                self._preload_params()
+                # Connection present — show machine type picker first if not configured,
+                # then PIN overlay. Use callback chaining to guarantee order.
+                Clock.schedule_once(lambda *_: self._show_startup_flow(), 0)
+                return
             # Optional auto-connect via env var
             addr = os.environ.get('DMC_ADDRESS', '').strip()
             if addr:
@@ -535,6 +542,11 @@ class DMCApp(App):
                     Clock.schedule_once(lambda *_: on_ui())
                 jobs.submit(do_auto)
 
+        def _do_probe():
+            present = self.controller.verify_connection()
+            Clock.schedule_once(lambda *_: _on_probe(present))
+        jobs.submit(_do_probe)
+
         # Trigger the setup screen to refresh and (optionally) auto-connect
         try:
             setup = next((s for s in root.ids.sm.screens if getattr(s, 'name', '') == 'setup'), None)
@@ -1096,23 +1108,27 @@ class DMCApp(App):
                     params[name] = val
             except Exception:
                 pass
-            # Batch 4: CPM values
-            for axis in ("A", "B", "C", "D"):
-                try:
-                    raw = ctrl.cmd(f"MG cpm{axis}").strip()
-                    params[f"cpm{axis}"] = float(raw)
-                except Exception:
-                    pass
-            # Batch 5: positions
+            # Batch 4: CPM values + positions fused into one MG
+            cpm_keys = [f"cpm{axis}" for axis in ("A", "B", "C", "D")]
+            pos_keys = ["_TPA", "_TPB", "_TPC", "_TPD"]
             try:
-                raw = ctrl.cmd("MG _TPA, _TPB, _TPC, _TPD").strip()
+                raw = ctrl.cmd("MG " + ", ".join(cpm_keys + pos_keys)).strip()
                 vals = [float(v) for v in raw.split()]
-                params["_TPA"] = vals[0]
-                params["_TPB"] = vals[1]
-                params["_TPC"] = vals[2]
-                params["_TPD"] = vals[3]
+                if len(vals) != len(cpm_keys) + len(pos_keys):
+                    raise ValueError(f"expected 8 values, got {len(vals)}")
+                params.update(zip(cpm_keys + pos_keys, vals))
             except Exception:
-                pass
+                # One undefined cpm variable fails the whole line; read apart
+                for key in cpm_keys:
+                    try:
+                        params[key] = float(ctrl.cmd(f"MG {key}").strip())
+                    except Exception:
+                        pass
+                try:
+                    raw = ctrl.cmd("MG " + ", ".join(pos_keys)).strip()
+                    params.update(zip(pos_keys, [float(v) for v in raw.split()]))
+                except Exception:
+                    pass
 
             def _apply(*_):
                 state.cached_params.update(params)
@@ -1352,6 +1368,16 @@ class DMCApp(App):
     # Messaging helpers
     # ------------------------------------------------------------------
 
+    def _queue_ctrl_msg(self, message: str) -> None:
+        """Controller logger (any thread): queue *message* for the main thread."""
+        self._ctrl_msgs.append(message)
+        self._ctrl_msgs_trigger()
+
+    def _drain_ctrl_msgs(self, _dt: float) -> None:
+        msgs = self._ctrl_msgs
+        while msgs:
+            self._log_message(msgs.popleft())
+
     def _log_message(self, message: str) -> None:
         # Push to ticker only; avoid spammy popups
         # Filter duplicate consecutive messages
@@ -38,6 +38,7 @@ Design notes
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Callable, Optional
 
 from kivy.clock import Clock
@@ -55,6 +56,78 @@ from dmccodegui.utils.jobs import submit  # noqa: F401 — re-exported for test
 
 logger = logging.getLogger(__name__)
 
+# Run-screen position StringProperties, in axis order A..D
+_POS_PROPS = ("pos_a", "pos_b", "pos_c", "pos_d")
+
+
+# Tracks whether the app window is minimized/hidden (see window_hidden()).
+_window_state = {"bound": False, "hidden": False}
+
+
+def _set_window_hidden(hidden: bool) -> None:
+    _window_state["hidden"] = hidden
+
+
+def window_hidden() -> bool:
+    """Return True while the app window is minimized or hidden.
+
+    Binds the Window minimize/hide/restore/show events on first call, so
+    importing this module does not create the Window.
+    """
+    if not _window_state["bound"]:
+        _window_state["bound"] = True
+        try:
+            from kivy.core.window import Window  # noqa: PLC0415
+            Window.bind(
+                on_minimize=lambda *_: _set_window_hidden(True),
+                on_hide=lambda *_: _set_window_hidden(True),
+                on_restore=lambda *_: _set_window_hidden(False),
+                on_show=lambda *_: _set_window_hidden(False),
+                on_maximize=lambda *_: _set_window_hidden(False),
+            )
+        except Exception:  # pragma: no cover — no window provider (headless)
+            pass
+    return _window_state["hidden"]
+
+
+def sync_text_size(widget, size) -> None:
+    """``size`` binding callback: keep a Label's text_size equal to its size.
+
+    One shared function for every generated label, instead of a fresh
+    ``widget.setter('text_size')`` partial per widget.
+    """
+    widget.text_size = size
+
+
+def _motion_probe_cmd(axis_list: list[str]) -> str:
+    """Build one MG command that reads _TD then _BG for every axis in *axis_list*.
+
+    Example: ["A", "B"] -> "MG _TDA,_TDB,_BGA,_BGB"
+    """
+    operands = [f"_TD{a}" for a in axis_list] + [f"_BG{a}" for a in axis_list]
+    return "MG " + ",".join(operands)
+
+
+def _parse_motion_reply(
+    raw: str, axis_list: list[str]
+) -> Optional[tuple[dict[str, str], bool]]:
+    """Parse the reply to _motion_probe_cmd(axis_list).
+
+    Returns ({axis: "pos.1f"}, all_idle) or None when the reply does not
+    contain exactly two values per axis.
+    """
+    parts = raw.split()
+    n = len(axis_list)
+    if len(parts) != 2 * n:
+        return None
+    try:
+        values = [float(p) for p in parts]
+    except ValueError:
+        return None
+    positions = {axis: f"{values[i]:.1f}" for i, axis in enumerate(axis_list)}
+    all_idle = not any(values[n:])
+    return positions, all_idle
+
 
 # ---------------------------------------------------------------------------
 # SetupScreenMixin
@@ -245,6 +318,7 @@ class BaseRunScreen(Screen):
     state = ObjectProperty(None, allownone=True)
 
     _state_unsub: Optional[Callable[[], None]] = None
+    _last_pos_counts: Optional[tuple[int, ...]] = None  # see _set_positions
 
     def on_pre_enter(self, *args) -> None:
         """Subscribe to MachineState and apply current state immediately."""
@@ -269,6 +343,26 @@ class BaseRunScreen(Screen):
         """Called on every MachineState update. Override in subclasses."""
         pass
 
+    def _set_positions(self, *values: float) -> None:
+        """Assign axis positions to pos_a, pos_b, ... as comma-grouped integer counts.
+
+        DR packets and the TCP poll both deliver positions several times a
+        second, mostly unchanged at idle; formatting and property writes are
+        skipped when the integer counts match the last applied ones.
+        """
+        counts = tuple(int(v) for v in values)
+        if counts == self._last_pos_counts:
+            return
+        self._last_pos_counts = counts
+        for prop, n in zip(_POS_PROPS, counts):
+            setattr(self, prop, f"{n:,}")
+
+    def _clear_positions(self, *props: str) -> None:
+        """Show '---' in the given position properties and forget the last counts."""
+        self._last_pos_counts = None
+        for prop in props:
+            setattr(self, prop, "---")
+
     def cleanup(self) -> None:
         """Tear down all resources owned by this run screen. Non-blocking and idempotent.
 
@@ -345,6 +439,13 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
         # so overlapping calls (e.g. user clicking Rest then Start quickly) are
         # ignored instead of stacking two polling loops on the jobs worker.
         self._motion_poll_active: bool = False
+        # Coalesced live-position updates from the motion poll loop; filled
+        # on the jobs thread, drained on the main thread, both under the lock
+        self._pending_live_pos: dict[str, str] = {}
+        self._live_pos_lock = threading.Lock()
+        self._live_pos_trigger = None
+        # pos_{axis} label widgets, cached on first lookup
+        self._pos_labels: dict[str, object] = {}
 
     def on_pre_enter(self, *args) -> None:
         """Subscribe to MachineState and enter setup mode."""
@@ -474,16 +575,6 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
             self.__class__.__name__, axis, self._current_step_mm, cpm, counts,
         )
         ctrl = self.controller
-        lbl_id = f"pos_{axis.lower()}"
-
-        def _push_pos(val_str: str) -> None:
-            def _update(*_):
-                if hasattr(self, 'pos_current'):
-                    self.pos_current[axis] = val_str  # type: ignore[attr-defined]
-                lbl = self.ids.get(lbl_id)
-                if lbl:
-                    lbl.text = val_str
-            Clock.schedule_once(_update)
 
         def do_jog():
             import time  # noqa: PLC0415
@@ -499,25 +590,29 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
                 ctrl.cmd(f"PR{axis}={counts}")
                 ctrl.cmd(f"BG{axis}")
 
-                # Poll position live while axis is moving
+                # Poll position live while axis is moving — one MG per tick
+                # returns both _TD and _BG; stop on idle or an unreadable reply
+                probe = _motion_probe_cmd([axis])
+                last_val = None
                 for _ in range(60):
                     time.sleep(0.1)
                     try:
-                        raw = ctrl.cmd(f"MG _TD{axis}").strip()
-                        _push_pos(f"{float(raw):.1f}")
-                    except Exception:
-                        pass
-                    try:
-                        bg_raw = ctrl.cmd(f"MG _BG{axis}").strip()
-                        if float(bg_raw) == 0:
-                            break
+                        parsed = _parse_motion_reply(ctrl.cmd(probe), [axis])
                     except Exception:
+                        parsed = None
+                    if parsed is None:
+                        break
+                    positions, idle = parsed
+                    if positions[axis] != last_val:
+                        last_val = positions[axis]
+                        self._push_live_pos(axis, last_val)
+                    if idle:
                         break
 
                 # Final position read
                 raw = ctrl.cmd(f"MG _TD{axis}").strip()
                 final_val = f"{float(raw):.1f}"
-                _push_pos(final_val)
+                self._push_live_pos(axis, final_val)
                 Clock.schedule_once(
                     lambda *_, a=axis, c=counts, v=final_val: self._log_jog(a, c, v)
                 )
@@ -548,11 +643,44 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
         def _update(*_):
             if hasattr(self, 'pos_current'):
                 self.pos_current[axis] = val_str  # type: ignore[attr-defined]
-            lbl = self.ids.get(f"pos_{axis.lower()}")
-            if lbl:
+            lbl = self._pos_label(axis)
+            if lbl and lbl.text != val_str:
                 lbl.text = val_str
         Clock.schedule_once(_update)
 
+    def _pos_label(self, axis: str):
+        """Return the pos_{axis} KV label, caching the ids lookup once found."""
+        lbl = self._pos_labels.get(axis)
+        if lbl is None:
+            lbl = self.ids.get(f"pos_{axis.lower()}")
+            if lbl is not None:
+                self._pos_labels[axis] = lbl
+        return lbl
+
+    def _push_live_positions(self, updates: dict[str, str]) -> None:
+        """Batch variant of _push_live_pos for the motion poll loop.
+
+        Merges *updates* into a pending dict and fires a cached Clock trigger,
+        so several readings arriving before the next frame collapse into a
+        single main-thread update.
+        """
+        with self._live_pos_lock:
+            self._pending_live_pos.update(updates)
+        if self._live_pos_trigger is None:
+            self._live_pos_trigger = Clock.create_trigger(self._apply_live_positions)
+        self._live_pos_trigger()
+
+    def _apply_live_positions(self, *_) -> None:
+        """Main-thread: apply all pending live positions to pos_current and labels."""
+        with self._live_pos_lock:
+            pending, self._pending_live_pos = self._pending_live_pos, {}
+        for axis, val_str in pending.items():
+            if hasattr(self, 'pos_current'):
+                self.pos_current[axis] = val_str  # type: ignore[attr-defined]
+            lbl = self._pos_label(axis)
+            if lbl and lbl.text != val_str:
+                lbl.text = val_str
+
     def _poll_motion_until_idle(
         self,
         axis_list: list[str],
@@ -566,9 +694,9 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
           1. Wait up to 500 ms for any axis's _BG to go non-zero. If motion
              never starts, assume we're already at target and exit after a
              final readback — no long timeout penalty.
-          2. Poll _TD{axis} and _BG{axis} for each axis at 10 Hz, updating
-             pos_current and the KV labels live, until ALL axes are idle
-             (_BG == 0) or timeout_sec elapses.
+          2. Poll _TD and _BG for all axes in one batched MG at 10 Hz,
+             updating pos_current and the KV labels when a value changes,
+             until ALL axes are idle (_BG == 0) or timeout_sec elapses.
           3. One final _TD readback per axis so labels settle at exact final
              values, then log completion via _log_motion_complete (override
              in subclass for UI log).
@@ -629,22 +757,28 @@ class BaseAxesSetupScreen(Screen, SetupScreenMixin):
                     return
 
                 # -- Phase 2: poll until all axes idle -----------------------
+                # One batched MG per tick (all _TD then all _BG) instead of two
+                # round-trips per axis; labels are only pushed when the
+                # formatted value actually changes.
+                probe = _motion_probe_cmd(axis_list)
+                last_pushed: dict[str, str] = {}
                 max_ticks = int(timeout_sec * 10)
                 for _ in range(max_ticks):
                     time.sleep(0.1)
-                    all_idle = True
-                    for axis in axis_list:
-                        try:
-                            pos = ctrl.cmd(f"MG _TD{axis}").strip()
-                            self._push_live_pos(axis, f"{float(pos):.1f}")
-                        except Exception:
-                            pass
-                        try:
-                            raw = ctrl.cmd(f"MG _BG{axis}").strip()
-                            if float(raw) != 0:
-                                all_idle = False
-                        except Exception:
-                            pass
+                    try:
+                        parsed = _parse_motion_reply(ctrl.cmd(probe), axis_list)
+                    except Exception:
+                        parsed = None
+                    if parsed is None:
+                        continue
+                    positions, all_idle = parsed
+                    changed = {
+                        axis: val for axis, val in positions.items()
+                        if last_pushed.get(axis) != val
+                    }
+                    if changed:
+                        last_pushed.update(changed)
+                        self._push_live_positions(changed)
                     if all_idle:
                         break
                 else:
@@ -1048,7 +1182,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                 valign='middle',
                 color=accent,
             )
-            icon_lbl.bind(size=icon_lbl.setter('text_size'))
+            icon_lbl.bind(size=sync_text_size)
             header_row.add_widget(icon_lbl)
 
             # Group name
@@ -1060,7 +1194,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                 valign='middle',
                 color=accent,
             )
-            name_lbl.bind(size=name_lbl.setter('text_size'))
+            name_lbl.bind(size=sync_text_size)
             header_row.add_widget(name_lbl)
 
             # Param count badge
@@ -1073,7 +1207,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                 valign='middle',
                 color=list(theme.text_dim),
             )
-            count_lbl.bind(size=count_lbl.setter('text_size'))
+            count_lbl.bind(size=sync_text_size)
             header_row.add_widget(count_lbl)
 
             card.add_widget(header_row)
@@ -1114,7 +1248,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                     halign='left',
                     valign='middle',
                 )
-                lbl.bind(size=lbl.setter('text_size'))
+                lbl.bind(size=sync_text_size)
                 row.add_widget(lbl)
 
                 # Variable name (dim accent)
@@ -1126,7 +1260,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                     valign='middle',
                     color=[accent[0], accent[1], accent[2], 0.5],
                 )
-                var_lbl.bind(size=var_lbl.setter('text_size'))
+                var_lbl.bind(size=sync_text_size)
                 row.add_widget(var_lbl)
 
                 var_name = p['var']
@@ -1142,7 +1276,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                         valign='middle',
                         color=list(theme.text_mid),
                     )
-                    val_lbl.bind(size=val_lbl.setter('text_size'))
+                    val_lbl.bind(size=sync_text_size)
                     self._field_widgets[var_name] = val_lbl
                     row.add_widget(val_lbl)
                 else:
@@ -1167,7 +1301,7 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
                     valign='middle',
                     color=list(theme.text_dim),
                 )
-                unit_lbl.bind(size=unit_lbl.setter('text_size'))
+                unit_lbl.bind(size=sync_text_size)
                 row.add_widget(unit_lbl)
 
                 # Dirty dot indicator (hidden for readonly fields)
@@ -1237,7 +1371,13 @@ class BaseParametersScreen(Screen, SetupScreenMixin):
             self._clear_dirty(var_name)
 
     def _set_field_state(self, widget, state: str, var_name: str = '') -> None:
-        """Update border color of TextInput and dirty dot based on validation state."""
+        """Update border color of TextInput and dirty dot based on validation state.
+
+        No-op when *widget* is already in *state*, so per-keystroke validation
+        and bulk reads do not re-dispatch identical color/opacity writes.
+        """
+        if getattr(widget, '_param_state', None) == state:
+            return
         border_normal = [0.118, 0.145, 0.188, 1]
         border_amber = [0.980, 0.749, 0.043, 0.9]
         border_red = [0.900, 0.200, 0.200, 0.9]
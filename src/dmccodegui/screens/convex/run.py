@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import time
 from collections import deque
+from itertools import accumulate
 
 import kivy_matplotlib_widget  # noqa: F401 — registers MatplotFigure in Kivy Factory
 import matplotlib.pyplot  # noqa: F401 — required by kivy_matplotlib_widget internals
@@ -26,6 +27,7 @@ from matplotlib.ticker import MaxNLocator
 
 import dmccodegui.machine_config as mc
 from dmccodegui.screens.flat_grind.widgets import (
+    DELTA_C_LINE_MAX,
     DELTA_C_WRITABLE_START,
 )
 
@@ -40,7 +42,7 @@ from ...hmi.dmc_vars import (
     STATE_HOMING,
 )
 from ...utils import jobs
-from ..base import BaseRunScreen
+from ..base import BaseRunScreen, window_hidden
 
 logger = logging.getLogger(__name__)
 
@@ -333,15 +335,17 @@ class ConvexRunScreen(BaseRunScreen):
                 self._disconnect_t0 = None
 
             # Axis positions — format as integer with comma thousands separator
-            for axis, prop in (("A", "pos_a"), ("B", "pos_b"), ("C", "pos_c"), ("D", "pos_d")):
-                val = s.pos.get(axis)
-                if val is not None:
+            try:
+                self._set_positions(*(s.pos[axis] for axis in ("A", "B", "C", "D")))
+            except (KeyError, ValueError, TypeError):
+                # Missing/invalid axis: fall back to per-axis display
+                self._last_pos_counts = None
+                for axis, prop in (("A", "pos_a"), ("B", "pos_b"), ("C", "pos_c"), ("D", "pos_d")):
+                    val = s.pos.get(axis)
                     try:
                         setattr(self, prop, f"{int(val):,}")
                     except (ValueError, TypeError):
                         setattr(self, prop, "---")
-                else:
-                    setattr(self, prop, "---")
 
             # Knife counts
             self.session_knife_count = str(s.session_knife_count)
@@ -397,10 +401,7 @@ class ConvexRunScreen(BaseRunScreen):
 
     def _show_disconnected(self) -> None:
         """Show disconnected state: '---' for all positions."""
-        self.pos_a = "---"
-        self.pos_b = "---"
-        self.pos_c = "---"
-        self.pos_d = "---"
+        self._clear_positions("pos_a", "pos_b", "pos_c", "pos_d")
 
     def _tick_elapsed(self, _dt: float) -> None:
         """1 Hz clock: update elapsed time display only."""
@@ -444,8 +445,12 @@ class ConvexRunScreen(BaseRunScreen):
         self._fig.tight_layout(pad=0.5)
 
     def _tick_plot(self, _dt: float) -> None:
-        """5 Hz Kivy clock: redraw the live A/B trace in mm. Main thread only."""
-        if self._plot_line is None:
+        """5 Hz Kivy clock: redraw the live A/B trace in mm. Main thread only.
+
+        Skipped while the window is minimized — nobody can see the redraw,
+        and the first tick after restore draws the full buffer anyway.
+        """
+        if self._plot_line is None or window_hidden():
             return
         xs_raw = list(self._plot_buf_x)
         ys_raw = list(self._plot_buf_y)
@@ -712,19 +717,11 @@ class ConvexRunScreen(BaseRunScreen):
 
         def _send():
             try:
-                line = ""
-                written = 0
-                for idx, v in changed:
-                    cmd = f"deltaC[{DELTA_C_WRITABLE_START + idx}]={round(v):.0f}"
-                    if len(line) + len(cmd) + 1 < 80:
-                        line = f"{line};{cmd}" if line else cmd
-                    else:
-                        ctrl.cmd(line)
-                        written += line.count("=")
-                        line = cmd
-                if line:
-                    ctrl.cmd(line)
-                    written += line.count("=")
+                ctrl.cmd_batch([
+                    f"deltaC[{DELTA_C_WRITABLE_START + idx}]={round(v):.0f}"
+                    for idx, v in changed
+                ], line_max=DELTA_C_LINE_MAX)
+                written = len(changed)
                 self._last_delta_c = list(values)
                 logger.debug("deltaC written: %d elements", written)
             except Exception as e:
@@ -873,14 +870,8 @@ class ConvexRunScreen(BaseRunScreen):
                     n = min(len(delta_a), len(delta_b))
                     cpm_a = self._cpm_a_raw
                     cpm_b = self._cpm_b_raw
-                    acc_a, acc_b = start_a, start_b
-                    ca = [acc_a / cpm_a]
-                    cb = [acc_b / cpm_b]
-                    for i in range(n):
-                        acc_a += delta_a[i]
-                        acc_b += delta_b[i]
-                        ca.append(acc_a / cpm_a)
-                        cb.append(acc_b / cpm_b)
+                    ca = [p / cpm_a for p in accumulate(delta_a[:n], initial=start_a)]
+                    cb = [p / cpm_b for p in accumulate(delta_b[:n], initial=start_b)]
                     contour_a_mm = ca
                     contour_b_mm = cb
                     logger.debug("Contour: A=%.1f->%.1f, B=%.1f->%.1f",
@@ -6,6 +6,7 @@ import sys
 import threading
 import time
 from collections import deque
+from itertools import accumulate
 
 import kivy_matplotlib_widget  # noqa: F401 — registers MatplotFigure in Kivy Factory
 import matplotlib.pyplot  # noqa: F401 — required by kivy_matplotlib_widget internals
@@ -33,10 +34,11 @@ from ...hmi.dmc_vars import (
 )
 from ...hmi.poll import read_all_state
 from ...utils import jobs
-from ..base import BaseRunScreen
+from ..base import BaseRunScreen, window_hidden
 from .widgets import (
     ARROW_DOWN_IMG,
     ARROW_UP_IMG,
+    DELTA_C_LINE_MAX,
     DELTA_C_WRITABLE_START,
     ImageButton,
 )
@@ -332,12 +334,7 @@ class FlatGrindRunScreen(BaseRunScreen):
             # --- Position updates from DR ---
             a = s.pos.get("A", 0.0)
             b = s.pos.get("B", 0.0)
-            c = s.pos.get("C", 0.0)
-            d = s.pos.get("D", 0.0)
-            self.pos_a = f"{int(a):,}"
-            self.pos_b = f"{int(b):,}"
-            self.pos_c = f"{int(c):,}"
-            self.pos_d = f"{int(d):,}"
+            self._set_positions(a, b, s.pos.get("C", 0.0), s.pos.get("D", 0.0))
 
             # --- Knife counts + stone position from DR ---
             self.session_knife_count = str(s.session_knife_count)
@@ -407,10 +404,7 @@ class FlatGrindRunScreen(BaseRunScreen):
 
     def _show_disconnected(self) -> None:
         """Show disconnected state: '---' for all positions."""
-        self.pos_a = "---"
-        self.pos_b = "---"
-        self.pos_c = "---"
-        self.pos_d = "---"
+        self._clear_positions("pos_a", "pos_b", "pos_c", "pos_d")
 
     # -----------------------------------------------------------------------
     # Lightweight position poll — only runs during grind cycle
@@ -480,24 +474,15 @@ class FlatGrindRunScreen(BaseRunScreen):
                 delta_b = ctrl.upload_array_auto("deltaB")
                 if delta_a and delta_b:
                     n = min(len(delta_a), len(delta_b))
-                    acc_a, acc_b = start_a, start_b
-                    ca, cb = [start_a_mm], [start_b_mm]
-                    for k in range(n):
-                        acc_a += delta_a[k]
-                        acc_b += delta_b[k]
-                        ca.append(acc_a / cpm_a)
-                        cb.append(acc_b / cpm_b)
-                    contour_a_mm = ca
-                    contour_b_mm = cb
+                    # Running position in counts (cumsum from startPt), then mm
+                    contour_a_mm = [p / cpm_a for p in accumulate(delta_a[:n], initial=start_a)]
+                    contour_b_mm = [p / cpm_b for p in accumulate(delta_b[:n], initial=start_b)]
             except Exception:
                 pass
 
             def _apply(*_):
                 # Positions
-                self.pos_a = f"{int(a):,}"
-                self.pos_b = f"{int(b):,}"
-                self.pos_c = f"{int(c):,}"
-                self.pos_d = f"{int(d):,}"
+                self._set_positions(a, b, c, d)
                 self.session_knife_count = str(ses_kni)
                 self.stone_knife_count = str(stn_kni)
                 # Guard: don't overwrite if on_start_grind already fired
@@ -615,10 +600,7 @@ class FlatGrindRunScreen(BaseRunScreen):
             def _apply(*_):
                 self._pos_busy = False  # ready for next tick
                 # Update positions on screen
-                self.pos_a = f"{int(a):,}"
-                self.pos_b = f"{int(b):,}"
-                self.pos_c = f"{int(c):,}"
-                self.pos_d = f"{int(d):,}"
+                self._set_positions(a, b, c, d)
                 # Feed plot buffer only during grind
                 if dmc_state == STATE_GRINDING:
                     self._plot_buf_x.append(a)
@@ -642,7 +624,8 @@ class FlatGrindRunScreen(BaseRunScreen):
                     self._stop_pos_poll()
                     self._stop_elapsed()
                     self._read_start_pt_c()
-                Clock.schedule_once(_apply)
+
+            Clock.schedule_once(_apply)
 
         jobs.submit(_do)
 
@@ -670,8 +653,12 @@ class FlatGrindRunScreen(BaseRunScreen):
         self._fig.subplots_adjust(left=0.12, right=0.97, top=0.97, bottom=0.18)
 
     def _tick_plot(self, _dt: float) -> None:
-        """5 Hz Kivy clock: redraw the live A/B trace in mm. Main thread only."""
-        if self._plot_line is None:
+        """5 Hz Kivy clock: redraw the live A/B trace in mm. Main thread only.
+
+        Skipped while the window is minimized — nobody can see the redraw,
+        and the first tick after restore draws the full buffer anyway.
+        """
+        if self._plot_line is None or window_hidden():
             return
         xs_raw = list(self._plot_buf_x)
         ys_raw = list(self._plot_buf_y)
@@ -1099,19 +1086,11 @@ class FlatGrindRunScreen(BaseRunScreen):
 
         def _send():
             try:
-                line = ""
-                written = 0
-                for idx, v in changed:
-                    cmd = f"deltaC[{DELTA_C_WRITABLE_START + idx}]={round(v):.0f}"
-                    if len(line) + len(cmd) + 1 < 80:
-                        line = f"{line};{cmd}" if line else cmd
-                    else:
-                        ctrl.cmd(line)
-                        written += line.count("=")
-                        line = cmd
-                if line:
-                    ctrl.cmd(line)
-                    written += line.count("=")
+                ctrl.cmd_batch([
+                    f"deltaC[{DELTA_C_WRITABLE_START + idx}]={round(v):.0f}"
+                    for idx, v in changed
+                ], line_max=DELTA_C_LINE_MAX)
+                written = len(changed)
                 # Cache sent values for next diff
                 self._last_delta_c = list(values)
                 logger.debug("deltaC written: %d elements", written)
@@ -1234,14 +1213,8 @@ class FlatGrindRunScreen(BaseRunScreen):
                     n = min(len(delta_a), len(delta_b))
                     cpm_a = self._cpm_a_raw
                     cpm_b = self._cpm_b_raw
-                    acc_a, acc_b = start_a, start_b
-                    ca = [acc_a / cpm_a]
-                    cb = [acc_b / cpm_b]
-                    for i in range(n):
-                        acc_a += delta_a[i]
-                        acc_b += delta_b[i]
-                        ca.append(acc_a / cpm_a)
-                        cb.append(acc_b / cpm_b)
+                    ca = [p / cpm_a for p in accumulate(delta_a[:n], initial=start_a)]
+                    cb = [p / cpm_b for p in accumulate(delta_b[:n], initial=start_b)]
                     contour_a_mm = ca
                     contour_b_mm = cb
                     logger.debug("Contour: A=%.1f->%.1f, B=%.1f->%.1f",
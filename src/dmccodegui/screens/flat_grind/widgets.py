@@ -21,6 +21,9 @@ Constants
 DELTA_C_WRITABLE_START, DELTA_C_WRITABLE_END, DELTA_C_ARRAY_SIZE, DELTA_C_STEP
     Controller array bounds and increment for the deltaC array.
 
+DELTA_C_LINE_MAX
+    Line length limit for packed deltaC writes.
+
 STONE_SURFACE_MM, STONE_OVERHANG_MM, STEP_MM, STONE_WINDOW_INDICES
     Stone geometry constants for windowed compensation.
 
@@ -62,6 +65,7 @@ DELTA_C_WRITABLE_START: int = 0    # First writable index in the deltaC array on
 DELTA_C_WRITABLE_END: int = 99     # Last writable index (inclusive) — 100 elements total
 DELTA_C_ARRAY_SIZE: int = DELTA_C_WRITABLE_END - DELTA_C_WRITABLE_START + 1  # = 100
 DELTA_C_STEP: int = 50             # Adjustment increment per button press in controller counts
+DELTA_C_LINE_MAX: int = 80         # Packed deltaC writes stay under 80 chars per command line
 
 # Stone geometry for windowed compensation
 STONE_SURFACE_MM: float = 40.0       # grinding surface width (outer - inner diameter / 2)
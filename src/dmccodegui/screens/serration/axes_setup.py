@@ -253,7 +253,7 @@ class SerrationAxesSetupScreen(BaseAxesSetupScreen):
         dict changes, so we must update the Label.text imperatively.
         """
         for axis in ("A", "B", "C"):
-            lbl = self.ids.get(f"pos_{axis.lower()}")
+            lbl = self._pos_label(axis)
             if lbl:
                 lbl.text = self.pos_current.get(axis, "---")
 
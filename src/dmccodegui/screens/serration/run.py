@@ -216,9 +216,7 @@ class SerrationRunScreen(BaseRunScreen):
             a, b, c, _d, dmc_state, ses_kni, stn_kni, program_running = result
 
             def _apply(*_):
-                self.pos_a = f"{int(a):,}"
-                self.pos_b = f"{int(b):,}"
-                self.pos_c = f"{int(c):,}"
+                self._set_positions(a, b, c)
                 self.session_knife_count = str(ses_kni)
                 self.stone_knife_count = str(stn_kni)
                 # Guard: don't overwrite if on_start_grind already fired
@@ -284,9 +282,7 @@ class SerrationRunScreen(BaseRunScreen):
 
             def _apply(*_):
                 self._pos_busy = False
-                self.pos_a = f"{int(a):,}"
-                self.pos_b = f"{int(b):,}"
-                self.pos_c = f"{int(c):,}"
+                self._set_positions(a, b, c)
                 self.session_knife_count = str(ses_kni)
                 self.stone_knife_count = str(stn_kni)
                 # Detect grind end: was grinding, now idle → stop polling
@@ -369,12 +365,7 @@ class SerrationRunScreen(BaseRunScreen):
                 self._disconnect_t0 = None
 
             # --- Position updates from DR (3-axis only, no D) ---
-            a = s.pos.get("A", 0.0)
-            b = s.pos.get("B", 0.0)
-            c = s.pos.get("C", 0.0)
-            self.pos_a = f"{int(a):,}"
-            self.pos_b = f"{int(b):,}"
-            self.pos_c = f"{int(c):,}"
+            self._set_positions(s.pos.get("A", 0.0), s.pos.get("B", 0.0), s.pos.get("C", 0.0))
 
             # --- Knife counts from DR ---
             self.session_knife_count = str(s.session_knife_count)
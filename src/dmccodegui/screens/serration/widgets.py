@@ -43,6 +43,8 @@ from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 
+from ..base import sync_text_size
+
 # ---------------------------------------------------------------------------
 # Compensation bounds and step
 # ---------------------------------------------------------------------------
@@ -107,7 +109,7 @@ class CompVisualization(Widget):
             size_hint=(None, None),
             size=(dp(200), dp(16)),
         )
-        self._label.bind(size=self._label.setter('text_size'))
+        self._label.bind(size=sync_text_size)
         self.add_widget(self._label)
         self.bind(pos=self._redraw, size=self._redraw)
 
@@ -258,6 +260,7 @@ class CompPanel(BoxLayout):
         # Storage for programmatic updates
         self._values: dict[int, float] = {}
         self._val_labels: dict[int, Label] = {}
+        self._columns: list[BoxLayout] = []
 
     def _on_refresh_pressed(self, *args) -> None:
         if self.refresh_callback is not None:
@@ -274,78 +277,89 @@ class CompPanel(BoxLayout):
         All laid out left-to-right, proportionally spaced to align with
         the dots on the CompVisualization above.
         Tooth 1 on the left.
+
+        Existing columns are reused: a refresh with the same serration count
+        only rewrites the value labels, and a count change adds or removes
+        columns at the end of the strip.
         """
-        self._strip.clear_widgets()
-        self._values.clear()
-        self._val_labels.clear()
-        self.num_serrations = len(values)
+        n = len(values)
+        while len(self._columns) > n:
+            self._strip.remove_widget(self._columns.pop())
+            self._values.pop(len(self._columns), None)
+            self._val_labels.pop(len(self._columns), None)
+        while len(self._columns) < n:
+            col = self._make_column(len(self._columns))
+            self._columns.append(col)
+            self._strip.add_widget(col)
+        self.num_serrations = n
 
         for i, val in enumerate(values):
             self._values[i] = val
-
-            col = BoxLayout(
-                orientation='vertical',
-                size_hint_x=1,  # proportional — all columns equal width
-                spacing=dp(1),
-            )
-
-            # Index label (top)
-            idx_lbl = Label(
-                text=str(i + 1),
-                font_size='14sp',
-                color=[0.396, 0.455, 0.545, 1],
-                size_hint_y=None,
-                height=dp(18),
-                halign='center',
-                valign='middle',
-            )
-            idx_lbl.bind(size=idx_lbl.setter('text_size'))
-            col.add_widget(idx_lbl)
-
-            # Up button (green arrow image)
-            up_btn = _ImageButton(
-                source=ARROW_UP_IMG,
-                size_hint_y=1,
-                allow_stretch=True,
-                keep_ratio=True,
-            )
-            up_btn.bind(
-                on_release=lambda btn, idx=i: self._on_step(idx, COMP_STEP_MM)
-            )
-            col.add_widget(up_btn)
-
-            # Value label (center)
-            val_lbl = Label(
-                text=f'{val:.1f}',
-                font_size='16sp',
-                bold=True,
-                color=[0.85, 0.85, 0.85, 1],
-                size_hint_y=None,
-                height=dp(22),
-                halign='center',
-                valign='middle',
-            )
-            val_lbl.bind(size=val_lbl.setter('text_size'))
-            self._val_labels[i] = val_lbl
-            col.add_widget(val_lbl)
-
-            # Down button (red arrow image)
-            down_btn = _ImageButton(
-                source=ARROW_DOWN_IMG,
-                size_hint_y=1,
-                allow_stretch=True,
-                keep_ratio=True,
-            )
-            down_btn.bind(
-                on_release=lambda btn, idx=i: self._on_step(idx, -COMP_STEP_MM)
-            )
-            col.add_widget(down_btn)
-
-            self._strip.add_widget(col)
+            self._val_labels[i].text = f'{val:.1f}'
 
         # Align element centers with viz dots
         self._update_strip_padding()
 
+    def _make_column(self, i: int) -> BoxLayout:
+        """Create the widget column for serration *i* (value label left blank)."""
+        col = BoxLayout(
+            orientation='vertical',
+            size_hint_x=1,  # proportional — all columns equal width
+            spacing=dp(1),
+        )
+
+        # Index label (top)
+        idx_lbl = Label(
+            text=str(i + 1),
+            font_size='14sp',
+            color=[0.396, 0.455, 0.545, 1],
+            size_hint_y=None,
+            height=dp(18),
+            halign='center',
+            valign='middle',
+        )
+        idx_lbl.bind(size=sync_text_size)
+        col.add_widget(idx_lbl)
+
+        # Up button (green arrow image)
+        up_btn = _ImageButton(
+            source=ARROW_UP_IMG,
+            size_hint_y=1,
+            allow_stretch=True,
+            keep_ratio=True,
+        )
+        up_btn.bind(
+            on_release=lambda btn, idx=i: self._on_step(idx, COMP_STEP_MM)
+        )
+        col.add_widget(up_btn)
+
+        # Value label (center)
+        val_lbl = Label(
+            font_size='16sp',
+            bold=True,
+            color=[0.85, 0.85, 0.85, 1],
+            size_hint_y=None,
+            height=dp(22),
+            halign='center',
+            valign='middle',
+        )
+        val_lbl.bind(size=sync_text_size)
+        self._val_labels[i] = val_lbl
+        col.add_widget(val_lbl)
+
+        # Down button (red arrow image)
+        down_btn = _ImageButton(
+            source=ARROW_DOWN_IMG,
+            size_hint_y=1,
+            allow_stretch=True,
+            keep_ratio=True,
+        )
+        down_btn.bind(
+            on_release=lambda btn, idx=i: self._on_step(idx, -COMP_STEP_MM)
+        )
+        col.add_widget(down_btn)
+        return col
+
     def _update_strip_padding(self, *args) -> None:
         """Recalculate strip padding so element centers align with viz dots.
 
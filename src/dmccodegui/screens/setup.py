@@ -13,9 +13,9 @@ KV FILE: ui/setup.kv
   - connection_status — StringProperty bound to a Label in the KV to show "Connected to X"
 
 THREADING MODEL:
-  All controller I/O (connect, disconnect, list_addresses, teach_point) runs in a
-  background thread via jobs.submit(). UI mutations are always posted back to the
-  Kivy main thread via Clock.schedule_once().
+  All controller I/O (connect, disconnect, list_addresses, verify_connection,
+  teach_point) runs in a background thread via jobs.submit(). UI mutations are
+  always posted back to the Kivy main thread via Clock.schedule_once().
 """
 from __future__ import annotations
 
@@ -49,6 +49,8 @@ class SetupScreen(Screen):
     connection_status: str = StringProperty("Not connected")  # Shown in KV Label
     _unsubscribe = None                        # Callable returned by state.subscribe() — call to unsubscribe
     _on_connect_cb = None                      # Callback invoked after successful connection
+    _refresh_trigger = None                    # Clock trigger coalescing refresh_addresses() calls
+    _refresh_force: bool = False               # Any coalesced caller asked for a forced rescan
 
     def on_kv_post(self, *_):
         """
@@ -57,8 +59,8 @@ class SetupScreen(Screen):
 
         What this does:
           1. Triggers address discovery with auto-connect enabled
-          2. Checks if a controller is already connected (e.g. from a previous session)
-             and syncs that state immediately
+          2. Probes on the jobs thread whether a controller is already connected
+             (e.g. from a previous session) and syncs that state when it answers
           3. Subscribes to MachineState changes so the connection_status label
              updates automatically whenever state.connected changes elsewhere in the app
 
@@ -68,11 +70,10 @@ class SetupScreen(Screen):
         self._autoconnect = True
         self.refresh_addresses()
 
-        # Reflect pre-existing connection immediately (e.g. controller was already open)
-        if self.controller and self.controller.verify_connection():
-            self.state.set_connected(True)
-            if not self.state.connected_address and self.address:
-                self.state.connected_address = self.address
+        # Reflect pre-existing connection (e.g. controller was already open).
+        # verify_connection is a controller round-trip, so probe on the jobs thread.
+        if self.controller:
+            jobs.submit(self._probe_existing_connection)
 
         # Subscribe to state changes so the status label stays in sync
         try:
@@ -85,6 +86,17 @@ class SetupScreen(Screen):
 
         self._sync_connection_status()
 
+    def _probe_existing_connection(self) -> None:
+        """Background job: mark state connected if the controller handle is already live."""
+        if not self.controller.verify_connection():
+            return
+
+        def on_ui(*_):
+            self.state.set_connected(True)
+            if not self.state.connected_address and self.address:
+                self.state.connected_address = self.address
+        Clock.schedule_once(on_ui)
+
     def on_pre_enter(self, *_):
         """
         Called by Kivy each time the operator navigates back to this screen.
@@ -179,8 +191,8 @@ class SetupScreen(Screen):
         """
         Record the current axis positions as a named point and store in MachineState.
 
-        Calls controller.teach_point(name) in the background, then reads back the
-        axis positions via read_status() and stores them in state.taught_points[name].
+        Calls controller.teach_point(name) in the background, which returns the
+        current axis positions, and stores them in state.taught_points[name].
 
         Parameters
         ----------
@@ -198,9 +210,7 @@ class SetupScreen(Screen):
 
         def do_teach() -> None:
             try:
-                self.controller.teach_point(name)
-                st  = self.controller.read_status()
-                pos = st.get("pos", {})
+                pos = self.controller.teach_point(name)
 
                 def on_ui() -> None:
                     self.state.taught_points[name] = {"pos": pos}
@@ -213,39 +223,50 @@ class SetupScreen(Screen):
 
         jobs.submit(do_teach)
 
-    def refresh_addresses(self) -> None:
+    def refresh_addresses(self, force: bool = False) -> None:
         """
         Discover available controller addresses and populate the addr_list GridLayout.
 
-        Runs controller.list_addresses() in a background thread. On completion,
-        populates ids.addr_list with one Button per found address. Clicking a button
-        calls select_address() to set self.address.
+        Runs controller.list_addresses() in a background thread. The controller
+        reuses a recent scan unless *force* is True (the explicit Refresh button).
+        On completion, populates ids.addr_list with one Button per found address.
+        Clicking a button calls select_address() to set self.address.
 
         Auto-connect logic (runs once per session if self._autoconnect is True):
           Priority: DMC_ADDRESS env var → ids.address TextInput → first discovered address
           After auto-connect fires, self._autoconnect is set to False so it doesn't
           repeat on subsequent calls to refresh_addresses().
 
+        Calls are coalesced through a Clock trigger: any number of refreshes
+        requested in the same frame (button spam, disconnect + on_pre_enter)
+        run one scan, forced if any caller forced it.
+
         To change the button style for discovered addresses: edit the Button creation
-        inside on_ui() below.
+        in _populate_addr_grid().
         """
+        self._refresh_force = self._refresh_force or force
+        if self._refresh_trigger is None:
+            self._refresh_trigger = Clock.create_trigger(self._refresh_addresses_now)
+        self._refresh_trigger()
+
+    def _refresh_addresses_now(self, *_) -> None:
+        """Trigger callback: run one address scan and repopulate ids.addr_list."""
+        force, self._refresh_force = self._refresh_force, False
+
         def do_list() -> None:
-            items = self.controller.list_addresses()
+            items = self.controller.list_addresses(force=force)
 
             def on_ui() -> None:
-                self.addresses = [(k, v) for k, v in items.items()]
+                addresses = [(k, v) for k, v in items.items()]
+                unchanged = addresses == self.addresses
+                self.addresses = addresses
                 grid = self.ids.get('addr_list')
                 if not grid:
                     return
 
-                # Repopulate the address grid
-                grid.clear_widgets()
-                from kivy.uix.button import Button
-                for addr, desc in self.addresses:
-                    label = desc.split('Rev')[0]  # Trim firmware revision info from display
-                    btn = Button(text=f"{label} | {addr}", size_hint_y=None, height='32dp')
-                    btn.bind(on_release=lambda *_, a=addr: self.select_address(a))
-                    grid.add_widget(btn)
+                # Repopulate the address grid (skipped when the list is unchanged)
+                if not (unchanged and grid.children):
+                    self._populate_addr_grid(grid)
 
                 # One-time auto-connect on startup
                 if self._autoconnect and not (self.state and self.state.connected):
@@ -268,6 +289,16 @@ class SetupScreen(Screen):
 
         jobs.submit(do_list)
 
+    def _populate_addr_grid(self, grid) -> None:
+        """Rebuild *grid* with one Button per entry in self.addresses."""
+        from kivy.uix.button import Button
+        grid.clear_widgets()
+        for addr, desc in self.addresses:
+            label = desc.split('Rev')[0]  # Trim firmware revision info from display
+            btn = Button(text=f"{label} | {addr}", size_hint_y=None, height='32dp')
+            btn.bind(on_release=lambda *_, a=addr: self.select_address(a))
+            grid.add_widget(btn)
+
     def initial_refresh(self) -> None:
         """
         Public entry point called by main.py after build() to trigger the first
@@ -716,3 +716,83 @@ def test_new_session_blocked_for_operator():
     assert len(submitted_fns) == 0, (
         "on_new_session must not submit any job when setup_unlocked=False"
     )
+
+
+# -- Motion poll batching --------------------------------------------------------
+
+
+def test_motion_probe_batches_all_axes():
+    """_motion_probe_cmd reads every _TD then every _BG in one MG."""
+    from dmccodegui.screens.base import _motion_probe_cmd, _parse_motion_reply
+
+    assert _motion_probe_cmd(["A", "B", "C"]) == "MG _TDA,_TDB,_TDC,_BGA,_BGB,_BGC"
+
+    positions, all_idle = _parse_motion_reply(" 10.04 -2.0 3.0 0.0 1.0 0.0\r\n", ["A", "B", "C"])
+    assert positions == {"A": "10.0", "B": "-2.0", "C": "3.0"}
+    assert all_idle is False
+
+    _, all_idle = _parse_motion_reply("1 2 0 0", ["A", "B"])
+    assert all_idle is True
+
+    # Wrong value count or garbage -> None (tick skipped)
+    assert _parse_motion_reply("1 2 3", ["A", "B"]) is None
+    assert _parse_motion_reply("1 ? 0 0", ["A", "B"]) is None
+
+
+def test_jog_poll_uses_one_command_per_tick():
+    """The jog live-poll reads _TD and _BG together in one MG per tick."""
+    from unittest.mock import MagicMock, patch
+
+    from dmccodegui.hmi.dmc_vars import STATE_SETUP
+    from dmccodegui.screens.flat_grind.axes_setup import FlatGrindAxesSetupScreen
+
+    screen = FlatGrindAxesSetupScreen()
+    ctrl = MagicMock()
+    ctrl.is_connected.return_value = True
+    ticks = iter(["100.0 1", "200.0 1", "300.0 0"])
+
+    def handler(cmd):
+        if cmd == "MG _TDA,_BGA":
+            return next(ticks)
+        return " 0.0000 "
+
+    ctrl.cmd.side_effect = handler
+    screen.controller = ctrl
+    screen.state = MagicMock()
+    screen.state.dmc_state = STATE_SETUP
+    screen._axis_cpm = {"A": 1200.0}
+    screen._cpm_ready = True
+
+    submitted_fns = []
+    with patch('dmccodegui.screens.base.submit', side_effect=lambda fn: submitted_fns.append(fn)), \
+            patch('time.sleep'):
+        screen.jog_axis("A", 1)
+        submitted_fns[0]()
+
+    cmds = [c[0][0] for c in ctrl.cmd.call_args_list]
+    assert cmds.count("MG _TDA,_BGA") == 3
+    assert "MG _BGA" not in cmds[1:], "per-tick _BG reads should be folded into the probe"
+
+
+def test_live_positions_pushed_from_worker_thread():
+    """_push_live_positions (jobs thread) and the main-thread drain share a lock."""
+    import threading
+
+    from dmccodegui.screens.flat_grind.axes_setup import FlatGrindAxesSetupScreen
+
+    screen = FlatGrindAxesSetupScreen()
+    screen._live_pos_trigger = lambda: None
+    axes = [f"X{i}" for i in range(50)]
+
+    def producer():
+        for n in range(200):
+            screen._push_live_positions({axis: str(n) for axis in axes})
+
+    worker = threading.Thread(target=producer)
+    worker.start()
+    while worker.is_alive():
+        screen._apply_live_positions()
+    worker.join()
+    screen._apply_live_positions()
+
+    assert all(screen.pos_current[axis] == "199" for axis in axes)
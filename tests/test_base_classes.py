@@ -635,3 +635,37 @@ def test_cleanup_base_parameters_idempotent():
     screen._state_unsub = None
 
     screen.cleanup()  # must not raise
+
+
+# ---------------------------------------------------------------------------
+# BaseRunScreen._set_positions — skip unchanged position writes
+# ---------------------------------------------------------------------------
+
+def test_set_positions_skips_unchanged_counts():
+    """_set_positions formats counts once and ignores repeats until cleared."""
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    r._set_positions(1234.6, -5.0, 0.0, 98765.0)
+    assert (r.pos_a, r.pos_b, r.pos_c, r.pos_d) == ("1,234", "-5", "0", "98,765")
+
+    r.pos_a = "sentinel"
+    r._set_positions(1234.2, -5.0, 0.0, 98765.0)  # same integer counts
+    assert r.pos_a == "sentinel"
+
+    r._clear_positions("pos_a", "pos_b", "pos_c", "pos_d")
+    assert r.pos_b == "---"
+    r._set_positions(1234.2, -5.0, 0.0, 98765.0)
+    assert r.pos_a == "1,234"
+
+
+def test_sync_text_size_shared_binding():
+    """sync_text_size mirrors a label's size into text_size on resize."""
+    from kivy.uix.label import Label
+
+    from dmccodegui.screens.base import sync_text_size
+
+    lbl = Label()
+    lbl.bind(size=sync_text_size)
+    lbl.size = (120, 30)
+    assert tuple(lbl.text_size) == (120, 30)
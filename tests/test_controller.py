@@ -0,0 +1,781 @@
+"""Unit tests for GalilController array transfer and command helpers.
+
+All tests drive the controller through a MagicMock gclib driver — no hardware.
+"""
+from __future__ import annotations
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+
+def _make_controller(driver=None):
+    from dmccodegui.controller import GalilController
+    ctrl = GalilController(driver=driver if driver is not None else MagicMock())
+    ctrl._connected = True
+    return ctrl
+
+
+# ---------------------------------------------------------------------------
+# upload_array fallbacks
+# ---------------------------------------------------------------------------
+
+class TestUploadArrayFallback(unittest.TestCase):
+    """upload_array without a working GArrayUpload."""
+
+    def _driver(self, handler):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = handler
+        return driver
+
+    def test_qu_single_round_trip(self):
+        """QU returns the whole range in one command."""
+        sent = []
+
+        def handler(cmd):
+            sent.append(cmd)
+            return "1.0000, 2.0000, 3.0000, 4.0000"
+
+        ctrl = _make_controller(self._driver(handler))
+        self.assertEqual(ctrl.upload_array("arr", 0, 3), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(sent, ["QU arr[],0,3,1"])
+
+    def test_mg_fallback_packs_full_lines(self):
+        """When QU fails, MG reads are packed up to CMD_LINE_MAX per line."""
+        from dmccodegui.controller import CMD_LINE_MAX
+        sent = []
+
+        def handler(cmd):
+            if cmd.startswith("QU"):
+                raise RuntimeError("question mark returned by controller")
+            if cmd.startswith("MG"):
+                sent.append(cmd)
+                return " ".join("7" for _ in cmd[3:].split(","))
+            return "0"
+
+        ctrl = _make_controller(self._driver(handler))
+        values = ctrl.upload_array("EdgeB", 0, 129)
+
+        self.assertEqual(len(values), 130)
+        self.assertTrue(all(v == 7.0 for v in values))
+        # 130 elements fit in 5 lines (vs. 65+ with the old 1-then-2 chunking)
+        self.assertLessEqual(len(sent), 5)
+        self.assertTrue(all(len(c) <= CMD_LINE_MAX for c in sent))
+
+    def test_unsupported_qu_is_probed_once(self):
+        """A refused QU is sent raw (no TC1, no UI log) and skipped until reconnect."""
+        sent = []
+
+        def handler(cmd):
+            sent.append(cmd)
+            if cmd.startswith("QU"):
+                raise RuntimeError("question mark returned by controller")
+            return " ".join("7" for _ in cmd[3:].split(","))
+
+        ctrl = _make_controller(self._driver(handler))
+        log = MagicMock()
+        ctrl.set_logger(log)
+        self.assertEqual(ctrl.upload_array("EdgeB", 0, 3), [7.0] * 4)
+        self.assertEqual(ctrl.upload_array("EdgeB", 0, 3), [7.0] * 4)
+
+        self.assertEqual([c for c in sent if c.startswith("QU")], ["QU EdgeB[],0,3,1"])
+        self.assertNotIn("TC1", sent)
+        self.assertFalse(any("Error" in str(c.args[0]) for c in log.call_args_list))
+
+    def test_missing_array_does_not_disable_qu(self):
+        from dmccodegui.controller import ControllerNotReadyError
+        sent = []
+
+        def handler(cmd):
+            sent.append(cmd)
+            if cmd.startswith("QU"):
+                raise RuntimeError("question mark returned by controller")
+            return "?"
+
+        ctrl = _make_controller(self._driver(handler))
+        for _ in range(2):
+            with self.assertRaises(ControllerNotReadyError):
+                ctrl.upload_array("Nope", 0, 3)
+        self.assertEqual(sum(c.startswith("QU") for c in sent), 2)
+
+
+class TestUploadArrayNative(unittest.TestCase):
+    """upload_array uses gclib.py's GArrayUpload(name, first, last) signature."""
+
+    def test_three_arg_list_result(self):
+        driver = MagicMock(spec=["GCommand", "GArrayUpload"])
+        driver.GArrayUpload.return_value = [1.0, 2.0, 3.0]
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.upload_array("EdgeB", 0, 2), [1.0, 2.0, 3.0])
+        driver.GArrayUpload.assert_called_once_with("EdgeB", 0, 2)
+        driver.GCommand.assert_not_called()
+
+    def test_delimiter_flag_wrapper(self):
+        driver = MagicMock(spec=["GCommand", "GArrayUpload"])
+        driver.GArrayUpload.side_effect = [TypeError("arity"), "4.0,5.0\r\n"]
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.upload_array("EdgeC", 3, 4), [4.0, 5.0])
+        self.assertEqual(driver.GArrayUpload.call_args.args, ("EdgeC", 3, 4, 1))
+
+
+class TestReadArraySlice(unittest.TestCase):
+    """read_array_slice/discover_length use bulk transfers, not one MG per element."""
+
+    def test_slice_uses_packed_lines(self):
+        sent = []
+
+        def handler(cmd):
+            sent.append(cmd)
+            return " ".join("3" for _ in cmd[3:].split(","))
+
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = handler
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.read_array_slice("EdgeB", 0, 100), [3.0] * 100)
+        self.assertLessEqual(len(sent), 4)
+
+    def test_slice_prefers_array_upload(self):
+        driver = MagicMock(spec=["GCommand", "GArrayUpload"])
+        driver.GArrayUpload.return_value = [1.0, 2.0, 3.0]
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.read_array_slice("EdgeB", 4, 3), [1.0, 2.0, 3.0])
+        driver.GArrayUpload.assert_called_once_with("EdgeB", 4, 6)
+        driver.GCommand.assert_not_called()
+
+    def test_discover_length_bulk_scan(self):
+        driver = MagicMock(spec=["GCommand", "GArrayUpload"])
+        driver.GArrayUpload.return_value = [5.0, 0.0, 7.0] + [0.0] * 20
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.discover_length("EdgeB", probe_max=23), 3)
+        driver.GArrayUpload.assert_called_once_with("EdgeB", 0, 22)
+        driver.GCommand.assert_not_called()
+
+    def test_discover_length_mg_stops_at_zero_run(self):
+        data = [1.0] * 10 + [0.0] * 140
+        sent = []
+
+        def handler(cmd):
+            sent.append(cmd)
+            if cmd == "MG EdgeB[-1]":
+                return "150.0000"
+            idx = [int(ref.split("[")[1].rstrip("]")) for ref in cmd[3:].split(",")]
+            return " ".join(str(data[i]) for i in idx)
+
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = handler
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.discover_length("EdgeB"), 10)
+        # length query + one packed line; the rest of the array is never read
+        self.assertEqual(len(sent), 2)
+
+    def test_discover_length_undeclared_array(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = RuntimeError("question mark")
+        ctrl = _make_controller(driver)
+        self.assertEqual(ctrl.discover_length("Nope"), 0)
+
+    def test_discover_length_mg_stops_at_bad_array_error(self):
+        lines = []
+
+        def handler(cmd):
+            if cmd == "MG EdgeB[-1]":
+                return "150.0000"
+            if cmd.startswith("TC"):
+                return "57 Bad function or array"
+            lines.append(cmd)
+            if len(lines) > 1:
+                raise RuntimeError("Bad function or array")
+            return " ".join("1" for _ in cmd[3:].split(","))
+
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = handler
+        ctrl = _make_controller(driver)
+
+        # partial length from the lines read before the error, no exception
+        self.assertEqual(ctrl.discover_length("EdgeB"), len(lines[0][3:].split(",")))
+        self.assertEqual(len(lines), 2)
+
+    def test_slice_over_several_mg_lines(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = lambda cmd: ", ".join("2" for _ in cmd[3:].split(","))
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.read_array_slice("EdgeB", 0, 60), [2.0] * 60)
+        self.assertGreater(driver.GCommand.call_count, 1)
+
+    def test_question_mark_raises_not_ready(self):
+        from dmccodegui.controller import ControllerNotReadyError
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = "?"
+        ctrl = _make_controller(driver)
+
+        with self.assertRaises(ControllerNotReadyError):
+            ctrl.read_array_slice("EdgeC", 0, 5)
+
+
+# ---------------------------------------------------------------------------
+# list_addresses TTL cache
+# ---------------------------------------------------------------------------
+
+class TestListAddressesCache(unittest.TestCase):
+    """list_addresses reuses a recent GAddresses scan unless forced."""
+
+    def test_cached_within_ttl_and_force_rescans(self):
+        driver = MagicMock()
+        driver.GAddresses.return_value = {"192.168.0.2": "DMC4040 Rev 1.3"}
+        ctrl = _make_controller(driver)
+
+        first = ctrl.list_addresses()
+        second = ctrl.list_addresses()
+        self.assertEqual(first, second)
+        self.assertEqual(driver.GAddresses.call_count, 1)
+
+        ctrl.list_addresses(force=True)
+        self.assertEqual(driver.GAddresses.call_count, 2)
+
+    def test_expired_cache_rescans(self):
+        from dmccodegui.controller import ADDRESS_CACHE_TTL_S
+        driver = MagicMock()
+        driver.GAddresses.return_value = {}
+        ctrl = _make_controller(driver)
+
+        ctrl.list_addresses()
+        ctrl._addr_ts -= ADDRESS_CACHE_TTL_S + 1
+        ctrl.list_addresses()
+        self.assertEqual(driver.GAddresses.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        driver = MagicMock()
+        driver.GAddresses.side_effect = [OSError("scan failed"), {"10.0.0.5": "DMC"}]
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.list_addresses(), {})
+        self.assertEqual(ctrl.list_addresses(), {"10.0.0.5": "DMC"})
+
+
+class TestArrayRefs(unittest.TestCase):
+    """_array_refs builds (and caches) MG operand lists."""
+
+    def test_refs_string(self):
+        from dmccodegui.controller import _array_refs
+        self.assertEqual(_array_refs("arr", 2, 5), "arr[2],arr[3],arr[4]")
+        self.assertIs(_array_refs("arr", 2, 5), _array_refs("arr", 2, 5))
+
+    def test_template_shared_across_offsets(self):
+        from dmccodegui.controller import _array_refs, _ref_template
+        _ref_template.cache_clear()
+        self.assertEqual(_array_refs("tpl", 0, 2), "tpl[0],tpl[1]")
+        self.assertEqual(_array_refs("tpl", 7, 9), "tpl[7],tpl[8]")
+        self.assertEqual(_ref_template.cache_info().misses, 1)
+
+
+class TestParseNumberList(unittest.TestCase):
+    """parse_number_list handles MG/QU reply formats."""
+
+    def test_mixed_separators(self):
+        from dmccodegui.controller import parse_number_list
+        self.assertEqual(parse_number_list(" 1.0000, 2.5\r\n 3e2 \r\n"), [1.0, 2.5, 300.0])
+        self.assertEqual(parse_number_list(""), [])
+
+    def test_bad_token_raises(self):
+        from dmccodegui.controller import parse_number_list
+        with self.assertRaises(ValueError):
+            parse_number_list("1.0 ? 3.0")
+
+    def test_comma_and_space_in_one_line(self):
+        from dmccodegui.controller import parse_number_list
+        self.assertEqual(parse_number_list("4,5 6"), [4.0, 5.0, 6.0])
+
+    def test_limit_truncates(self):
+        from dmccodegui.controller import parse_number_list
+        self.assertEqual(parse_number_list("1\r\n2\r\n3", limit=2), [1.0, 2.0])
+
+    def test_split_tokens(self):
+        from dmccodegui.controller import _split_tokens
+        self.assertEqual(_split_tokens(",1.0, 2\r\n3,\r\n"), ["1.0", "2", "3"])
+        self.assertEqual(_split_tokens(" \r\n"), [])
+
+
+# ---------------------------------------------------------------------------
+# Assignment chunking (download_array fallback / write_array)
+# ---------------------------------------------------------------------------
+
+class TestSendAssignments(unittest.TestCase):
+    """Assignments are packed into ';'-joined lines under CMD_LINE_MAX."""
+
+    def _ctrl(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = ""
+        return _make_controller(driver), driver
+
+    def test_download_array_fallback_chunks(self):
+        from dmccodegui.controller import CMD_LINE_MAX
+        ctrl, driver = self._ctrl()
+        values = [float(i) + 0.5 for i in range(100)]
+
+        self.assertEqual(ctrl.download_array("deltaC", 0, values), 100)
+
+        lines = [c.args[0] for c in driver.GCommand.call_args_list]
+        self.assertTrue(all(len(line) < CMD_LINE_MAX for line in lines))
+        assigns = ";".join(lines).split(";")
+        self.assertEqual(assigns, [f"deltaC[{i}]={v}" for i, v in enumerate(values)])
+
+    def test_cmd_batch_packs_lines_and_joins_replies(self):
+        from dmccodegui.controller import CMD_LINE_MAX
+        ctrl, driver = self._ctrl()
+        driver.GCommand.side_effect = [" 1.0000", ""]
+        cmds = [f"MG var{i:03d}" for i in range(40)]
+
+        self.assertEqual(ctrl.cmd_batch(cmds), " 1.0000")
+
+        lines = [c.args[0] for c in driver.GCommand.call_args_list]
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(len(line) < CMD_LINE_MAX for line in lines))
+
+    def test_cmd_batch_line_max(self):
+        ctrl, driver = self._ctrl()
+        cmds = [f"deltaC[{i}]=50" for i in range(30)]
+        ctrl.cmd_batch(cmds, line_max=80)
+
+        lines = [c.args[0] for c in driver.GCommand.call_args_list]
+        self.assertTrue(all(len(line) < 80 for line in lines))
+        self.assertEqual(";".join(lines).split(";"), cmds)
+        self.assertEqual(";".join(lines).split(";"), cmds)
+
+    def test_write_array_sorts_sparse_updates(self):
+        ctrl, driver = self._ctrl()
+        self.assertEqual(ctrl.write_array("arr", {5: 1.0, 2: 3.0}), 2)
+        driver.GCommand.assert_called_once_with("arr[2]=3.0;arr[5]=1.0")
+
+    def test_write_array_contiguous_uses_array_download(self):
+        driver = MagicMock(spec=["GCommand", "GArrayDownload"])
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.write_array("arr", {1: 2.0, 0: 1.0, 2: 3.0}), 3)
+
+        # gclib.py expects a list of values, not a pre-joined string
+        driver.GArrayDownload.assert_called_once_with("arr", 0, 2, [1.0, 2.0, 3.0])
+        driver.GCommand.assert_not_called()
+
+    def test_download_mode_cached_after_signature_mismatch(self):
+        driver = MagicMock(spec=["GCommand", "GArrayDownload"])
+        driver.GArrayDownload.side_effect = [TypeError("arity"), None, None]
+        ctrl = _make_controller(driver)
+
+        ctrl.download_array("arr", 0, [1.0, 2.0])
+        ctrl.download_array("arr", 0, [3.0, 4.0])
+
+        self.assertEqual(ctrl._download_mode, "ascii_delim")
+        self.assertEqual(driver.GArrayDownload.call_args_list[-1].args, ("arr", 0, 1, 1, "3.0,4.0"))
+        self.assertEqual(driver.GArrayDownload.call_count, 3)
+
+    def test_download_controller_error_propagates(self):
+        driver = MagicMock(spec=["GCommand", "GArrayDownload"])
+        driver.GArrayDownload.side_effect = RuntimeError("question mark")
+        ctrl = _make_controller(driver)
+
+        with self.assertRaises(RuntimeError):
+            ctrl.download_array("arr", 0, [1.0])
+        self.assertIsNone(ctrl._download_mode)
+        driver.GCommand.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# read_status
+# ---------------------------------------------------------------------------
+
+class TestReadStatus(unittest.TestCase):
+    """read_status fetches positions and speed in one round-trip."""
+
+    def test_single_batched_command(self):
+        from dmccodegui.controller import STATUS_CMD
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = " 1.0000 2.0000 -3.0000 4.0000 150.0000\r\n"
+        ctrl = _make_controller(driver)
+
+        st = ctrl.read_status()
+
+        self.assertEqual(st, {"pos": {"A": 1.0, "B": 2.0, "C": -3.0, "D": 4.0}, "speeds": 150.0})
+        driver.GCommand.assert_called_once_with(STATUS_CMD)
+
+    def test_falls_back_to_per_field_reads(self):
+        from dmccodegui.controller import STATUS_CMD
+
+        def handler(cmd):
+            if cmd == STATUS_CMD:
+                return "?"
+            return {"MG _TPA": "7", "MG _TSA": "9"}.get(cmd, "0")
+
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = handler
+        ctrl = _make_controller(driver)
+
+        st = ctrl.read_status()
+        self.assertEqual(st["pos"], {"A": 7.0, "B": 0.0, "C": 0.0, "D": 0.0})
+        self.assertEqual(st["speeds"], 9.0)
+
+    def test_teach_point_shares_status_cache(self):
+        from dmccodegui.controller import STATUS_CMD
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = "1 2 3 4 5"
+        ctrl = _make_controller(driver)
+
+        self.assertEqual(ctrl.teach_point("Start"), {"A": 1.0, "B": 2.0, "C": 3.0, "D": 4.0})
+        ctrl.read_status()
+        driver.GCommand.assert_called_once_with(STATUS_CMD)
+
+    def test_ttl_cache_shares_one_round_trip(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = "1 2 3 4 5"
+        ctrl = _make_controller(driver)
+
+        first = ctrl.read_status()
+        first["pos"]["A"] = 99.0  # caller mutation must not leak into the cache
+        second = ctrl.read_status()
+
+        self.assertEqual(second["pos"]["A"], 1.0)
+        driver.GCommand.assert_called_once()
+
+        ctrl.read_status(ttl_ms=0)
+        self.assertEqual(driver.GCommand.call_count, 2)
+
+
+# ---------------------------------------------------------------------------
+# Driver lifetime
+# ---------------------------------------------------------------------------
+
+class TestDriverPersistence(unittest.TestCase):
+    """The gclib driver object survives disconnect and is reused on reconnect."""
+
+    def test_reconnect_reuses_driver(self):
+        driver = MagicMock()
+        ctrl = _make_controller(driver)
+
+        ctrl.disconnect()
+        self.assertFalse(ctrl.is_connected())
+        self.assertIs(ctrl._driver, driver)
+
+        self.assertTrue(ctrl.connect("192.168.0.2"))
+        self.assertIs(ctrl._driver, driver)
+        driver.GClose.assert_called_once()
+        driver.GOpen.assert_called_once()
+
+    def test_connect_same_address_reuses_open_handle(self):
+        driver = MagicMock()
+        ctrl = _make_controller(driver)
+        ctrl._connected = False
+        self.assertTrue(ctrl.connect("192.168.0.2 -d"))
+        self.assertTrue(ctrl.connect("192.168.0.2"))
+        driver.GOpen.assert_called_once()
+        driver.GClose.assert_not_called()
+
+    def test_connect_new_address_closes_old_handle(self):
+        driver = MagicMock()
+        ctrl = _make_controller(driver)
+        ctrl._connected = False
+        ctrl.connect("192.168.0.2")
+        ctrl.connect("192.168.0.3")
+        driver.GClose.assert_called_once()
+        self.assertEqual(driver.GOpen.call_count, 2)
+
+    def test_list_addresses_creates_driver_once(self):
+        from unittest.mock import patch
+
+        from dmccodegui import controller
+        fake_gclib = MagicMock()
+        fake_gclib.py.return_value.GAddresses.return_value = {}
+        with patch.object(controller, "gclib", fake_gclib), \
+                patch.object(controller, "GCLIB_AVAILABLE", True):
+            ctrl = controller.GalilController()
+            ctrl.list_addresses(force=True)
+            ctrl.list_addresses(force=True)
+            ctrl.connect("10.0.0.1")
+        fake_gclib.py.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# UI logger hook
+# ---------------------------------------------------------------------------
+
+class TestCmdErrorTC1(unittest.TestCase):
+    """cmd() failures of one command fetch TC1 once per TC1_TTL_S burst."""
+
+    def test_tc1_reused_within_ttl(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = lambda c: "1 Unrecognized command" if c == "TC1" else 1 / 0
+        ctrl = _make_controller(driver)
+
+        for _ in range(3):
+            with self.assertRaisesRegex(RuntimeError, "Unrecognized"):
+                ctrl.cmd("XQ #NOPE")
+        tc1_calls = [c for c in driver.GCommand.call_args_list if c.args[0] == "TC1"]
+        self.assertEqual(len(tc1_calls), 1)
+
+    def test_tc1_failure_not_cached(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = RuntimeError("timeout")
+        ctrl = _make_controller(driver)
+
+        for _ in range(2):
+            with self.assertRaisesRegex(RuntimeError, "timeout"):
+                ctrl.cmd("SH")
+        self.assertEqual(driver.GCommand.call_count, 4)
+
+    def test_other_command_gets_fresh_tc1(self):
+        """A cached 57 from one command is not attached to another's failure."""
+        from dmccodegui.controller import ControllerNotReadyError
+        tc1 = iter(["57 Bad function or array", "1 Unrecognized command"])
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = lambda c: next(tc1) if c == "TC1" else 1 / 0
+        ctrl = _make_controller(driver)
+
+        with self.assertRaisesRegex(RuntimeError, "Bad function"):
+            ctrl.cmd("MG Nope[0]")
+        with self.assertRaises(RuntimeError) as cm:
+            ctrl.read_array_elem("EdgeB", 0)
+        self.assertNotIsInstance(cm.exception, ControllerNotReadyError)
+        self.assertIn("Unrecognized", str(cm.exception))
+
+    def test_success_clears_cached_tc1(self):
+        failing = [True, False, True]
+        driver = MagicMock(spec=["GCommand"])
+
+        def gcommand(cmd):
+            if cmd == "TC1":
+                return "1 Unrecognized command"
+            if failing.pop(0):
+                raise RuntimeError("question mark")
+            return "0"
+
+        driver.GCommand.side_effect = gcommand
+        ctrl = _make_controller(driver)
+        for _ in range(3):
+            try:
+                ctrl.cmd("TP")
+            except RuntimeError:
+                pass
+        tc1_calls = [c for c in driver.GCommand.call_args_list if c.args[0] == "TC1"]
+        self.assertEqual(len(tc1_calls), 2)
+
+
+class TestSetLogger(unittest.TestCase):
+    """set_logger installs a message sink; None restores the no-op default."""
+
+    def test_logger_receives_and_resets(self):
+        ctrl = _make_controller()
+        ctrl._gcommand = MagicMock(return_value="1")
+        seen = []
+        ctrl.set_logger(seen.append)
+        ctrl.cmd("TP")
+        self.assertEqual(seen, ["CMD TP -> 1"])
+
+        ctrl.set_logger(None)
+        ctrl.cmd("TP")
+        self.assertEqual(len(seen), 1)
+
+    def test_logger_errors_swallowed(self):
+        ctrl = _make_controller()
+        ctrl._gcommand = MagicMock(return_value="")
+        ctrl.set_logger(MagicMock(side_effect=RuntimeError("ui gone")))
+        self.assertEqual(ctrl.cmd("SH"), "")
+
+
+# ---------------------------------------------------------------------------
+# verify_connection
+# ---------------------------------------------------------------------------
+
+class TestVerifyConnection(unittest.TestCase):
+    """A successful probe is reused for VERIFY_TTL_S."""
+
+    def test_repeat_within_ttl_skips_probe(self):
+        from dmccodegui.controller import VERIFY_CMD
+        driver = MagicMock()
+        ctrl = _make_controller(driver)
+        ctrl._connected = False
+
+        self.assertTrue(ctrl.verify_connection())
+        self.assertTrue(ctrl.verify_connection())
+        driver.GCommand.assert_called_once_with(VERIFY_CMD)
+
+    def test_failure_not_cached(self):
+        driver = MagicMock()
+        driver.GCommand.side_effect = [RuntimeError("timeout"), "0"]
+        ctrl = _make_controller(driver)
+
+        self.assertFalse(ctrl.verify_connection())
+        self.assertFalse(ctrl.is_connected())
+        self.assertTrue(ctrl.verify_connection())
+        self.assertEqual(driver.GCommand.call_count, 2)
+
+
+# ---------------------------------------------------------------------------
+# wait_for_ready
+# ---------------------------------------------------------------------------
+
+class TestWaitForReady(unittest.TestCase):
+    """wait_for_ready probes axes and arrays with one compound MG per poll."""
+
+    def test_compound_probe(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = "0.0000 12.0000"
+        ctrl = _make_controller(driver)
+
+        ctrl.wait_for_ready(arrays=("EdgeB",))
+        driver.GCommand.assert_called_once_with("MG _TPA, EdgeB[0]")
+
+    def test_retries_without_tc1(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = [RuntimeError("question mark"), "0.0000"]
+        ctrl = _make_controller(driver)
+
+        ctrl.wait_for_ready(poll_s=0.0)
+        self.assertEqual([c.args[0] for c in driver.GCommand.call_args_list], ["MG _TPA", "MG _TPA"])
+
+    def test_backoff_doubles_up_to_poll_s(self):
+        from dmccodegui.controller import _poll_delay
+        self.assertEqual([_poll_delay(i, 0.001, 0.005) for i in range(5)],
+                         [0.001, 0.002, 0.004, 0.005, 0.005])
+        self.assertEqual([_poll_delay(i, 0.01, 0.2) for i in range(3)], [0.01, 0.02, 0.04])
+
+    def test_min_poll_s_passed_to_backoff(self):
+        from unittest.mock import patch
+
+        from dmccodegui import controller
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = [RuntimeError("question mark")] * 2 + ["0.0000"]
+        ctrl = _make_controller(driver)
+
+        with patch.object(controller, "_poll_delay", return_value=0.0) as delay:
+            ctrl.wait_for_ready(poll_s=0.2, min_poll_s=0.01)
+        self.assertEqual([c.args for c in delay.call_args_list], [(0, 0.01, 0.2), (1, 0.01, 0.2)])
+
+    def test_undeclared_array_returns_at_once(self):
+        driver = MagicMock(spec=["GCommand"])
+
+        def gcommand(cmd):
+            if cmd == "TC1":
+                return "57 Bad function or array\r\n"
+            raise RuntimeError("question mark")
+
+        driver.GCommand.side_effect = gcommand
+        ctrl = _make_controller(driver)
+
+        ctrl.wait_for_ready(arrays=("Nope",), timeout_s=2.0)
+        self.assertEqual(driver.GCommand.call_count, 2)  # probe + TC1, no retries
+
+    def test_stale_cached_57_does_not_end_wait(self):
+        """The probe asks TC1 afresh; a 57 cached by cmd() moments ago is ignored."""
+        from dmccodegui.controller import ControllerNotReadyError
+        tc1 = ["57 Bad function or array"]
+        driver = MagicMock(spec=["GCommand"])
+
+        def gcommand(cmd):
+            if cmd == "TC1":
+                return tc1[0]
+            raise RuntimeError("question mark")
+
+        driver.GCommand.side_effect = gcommand
+        ctrl = _make_controller(driver)
+        with self.assertRaisesRegex(RuntimeError, "Bad function"):
+            ctrl.cmd("MG _TPA, EdgeB[0]")  # same text as the probe below
+
+        tc1[0] = "22 Begin not valid with motor off"
+        with self.assertRaises(ControllerNotReadyError):
+            ctrl.wait_for_ready(arrays=("EdgeB",), timeout_s=0.05, poll_s=0.01)
+
+    def test_default_window_of_undeclared_array_is_empty(self):
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.side_effect = (
+            lambda cmd: "57 Bad function or array" if cmd == "TC1" else 1 / 0)
+        ctrl = _make_controller(driver)
+
+        start = time.monotonic()
+        self.assertEqual(ctrl.get_edges_default_window("Nope"), [])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_timeout_raises_not_ready(self):
+        from dmccodegui.controller import ControllerNotReadyError
+        driver = MagicMock(spec=["GCommand"])
+        driver.GCommand.return_value = "?"
+        ctrl = _make_controller(driver)
+
+        with self.assertRaises(ControllerNotReadyError):
+            ctrl.wait_for_ready(timeout_s=0.05, poll_s=0.01)
+
+
+class TestEdgeCache(unittest.TestCase):
+    """get_edges_window serves recent slices from memory when asked to."""
+
+    def _ctrl(self):
+        driver = MagicMock(spec=["GCommand", "GArrayUpload"])
+        driver.GCommand.return_value = "0.0000 1.0000"
+        driver.GArrayUpload.return_value = [1.0, 2.0, 3.0, 4.0]
+        return _make_controller(driver), driver
+
+    def test_sub_slice_served_from_cache(self):
+        ctrl, driver = self._ctrl()
+        self.assertEqual(ctrl.get_edges_window("EdgeB", 0, 4, ttl_s=1.0), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(ctrl.get_edges_window("EdgeB", 1, 2, ttl_s=1.0), [2.0, 3.0])
+        driver.GArrayUpload.assert_called_once()
+
+    def test_write_and_ttl_invalidate(self):
+        ctrl, driver = self._ctrl()
+        ctrl.get_edges_window("EdgeB", 0, 4, ttl_s=1.0)
+        ctrl.write_array("EdgeB", {2: 9.0})
+        ctrl.get_edges_window("EdgeB", 0, 4, ttl_s=1.0)
+        ctrl.get_edges_window("EdgeB", 0, 4, ttl_s=0)
+        self.assertEqual(driver.GArrayUpload.call_count, 3)
+
+    def test_default_reads_fresh_after_cmd_write(self):
+        """Without ttl_s, a read right after a cmd_batch() write sees the new value."""
+        ctrl, driver = self._ctrl()
+        self.assertEqual(ctrl.get_edges_window("EdgeB", 0, 4), [1.0, 2.0, 3.0, 4.0])
+        ctrl.cmd_batch(["EdgeB[0]=9"])
+        driver.GArrayUpload.return_value = [9.0, 2.0, 3.0, 4.0]
+        self.assertEqual(ctrl.get_edges_window("EdgeB", 0, 4), [9.0, 2.0, 3.0, 4.0])
+
+    def test_default_window_cache_hit_skips_controller(self):
+        ctrl, driver = self._ctrl()
+        ctrl._max_edges = 4
+        self.assertEqual(ctrl.get_edges_default_window("EdgeB", preferred=2, ttl_s=1.0), [1.0, 2.0])
+        driver.reset_mock()
+        self.assertEqual(ctrl.get_edges_default_window("EdgeB", preferred=2, ttl_s=1.0), [1.0, 2.0])
+        driver.GCommand.assert_not_called()
+        driver.GArrayUpload.assert_not_called()
+
+    def test_discover_length_ttl_and_invalidation(self):
+        ctrl, driver = self._ctrl()
+        ctrl._max_edges = 4
+        self.assertEqual(ctrl.discover_length("EdgeB", ttl_s=1.0), 4)
+        self.assertEqual(ctrl.discover_length("EdgeB", ttl_s=1.0), 4)
+        self.assertEqual(driver.GArrayUpload.call_count, 1)
+        ctrl.discover_length("EdgeB")  # default ttl_s=0 always probes
+        ctrl.write_array("EdgeB", {0: 5.0})
+        ctrl.discover_length("EdgeB", ttl_s=1.0)
+        self.assertEqual(driver.GArrayUpload.call_count, 3)
+
+
+# ---------------------------------------------------------------------------
+# _parse_float_str
+# ---------------------------------------------------------------------------
+
+class TestParseFloatStr(unittest.TestCase):
+    """_parse_float_str returns the first numeric token of a reply."""
+
+    def test_single_and_multi_value(self):
+        ctrl = _make_controller()
+        self.assertEqual(ctrl._parse_float_str(" 12.5000\r\n"), 12.5)
+        self.assertEqual(ctrl._parse_float_str(":, 3.0000, 4.0000"), 3.0)
+
+    def test_no_number_raises(self):
+        from dmccodegui.controller import ParseError
+        ctrl = _make_controller()
+        for reply in ("", "?", ": ?"):
+            with self.assertRaises(ParseError):
+                ctrl._parse_float_str(reply)
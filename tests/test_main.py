@@ -91,3 +91,31 @@ class TestAngleBackend:
         assert any(actual in line for line in gl_lines), (
             f"GL backend log should contain '{actual}', got: {gl_lines}"
         )
+
+
+# ---------------------------------------------------------------------------
+# TestControllerLogQueue
+# ---------------------------------------------------------------------------
+
+class TestControllerLogQueue:
+    """Controller log messages are queued and drained in order by one trigger."""
+
+    def test_drain_in_order(self):
+        from collections import deque
+        from unittest.mock import MagicMock
+
+        from dmccodegui.main import DMCApp
+
+        app = DMCApp.__new__(DMCApp)
+        app._ctrl_msgs = deque(maxlen=256)
+        app._ctrl_msgs_trigger = MagicMock()
+        app._log_message = MagicMock()
+
+        app._queue_ctrl_msg("one")
+        app._queue_ctrl_msg("two")
+        assert app._ctrl_msgs_trigger.call_count == 2
+        app._log_message.assert_not_called()
+
+        app._drain_ctrl_msgs(0.0)
+        assert [c.args[0] for c in app._log_message.call_args_list] == ["one", "two"]
+        assert not app._ctrl_msgs
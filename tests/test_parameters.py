@@ -75,6 +75,28 @@ def test_zero_rejected_for_pitch():
     assert result == 'error', f"Expected 'error' for zero pitch, got '{result}'"
 
 
+def test_set_field_state_skips_unchanged_state():
+    """_set_field_state only touches the dirty dot when the state actually flips."""
+    _setup_env()
+    from dmccodegui.screens.flat_grind.parameters import FlatGrindParametersScreen as ParametersScreen
+    screen = ParametersScreen()
+    widget = MagicMock()
+    widget._param_state = None
+    dot = MagicMock()
+    screen._dot_widgets = {'fdA': dot}
+
+    screen._set_field_state(widget, 'modified', 'fdA')
+    assert widget._param_state == 'modified'
+    assert dot.opacity == 1
+
+    dot.opacity = 'untouched'
+    screen._set_field_state(widget, 'modified', 'fdA')
+    assert dot.opacity == 'untouched', "repeat of the same state must not re-dispatch"
+
+    screen._set_field_state(widget, 'valid', 'fdA')
+    assert dot.opacity == 0
+
+
 def test_negative_rejected_for_feedrates():
     """PARAM-03: fdA with value -5 is flagged as error."""
     _setup_env()
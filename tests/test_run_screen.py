@@ -83,6 +83,67 @@ def test_delta_c_adjustment():
     assert hasattr(r, 'delta_c_offsets'), "Missing delta_c_offsets"
 
 
+def test_apply_delta_c_sends_one_batch():
+    """on_apply_delta_c() hands every changed index to one cmd_batch call."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    from unittest.mock import MagicMock, patch
+
+    from dmccodegui.controller import GalilController
+    from dmccodegui.screens.flat_grind.run import DELTA_C_WRITABLE_START, FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    mock_ctrl = MagicMock(spec=GalilController)
+    mock_ctrl.is_connected.return_value = True
+    r.controller = mock_ctrl
+    n = len(r._offsets_to_delta_c())
+    r._controller_delta_c = [0.0] * n
+    r._last_delta_c = [0.0] * n
+    r.delta_c_offsets = [5.0] + [0.0] * (max(1, int(r.section_count)) - 1)
+
+    captured_fn = []
+    with patch('dmccodegui.utils.jobs.submit', side_effect=captured_fn.append):
+        r.on_apply_delta_c()
+    captured_fn[0]()
+
+    mock_ctrl.cmd_batch.assert_called_once()
+    cmds = mock_ctrl.cmd_batch.call_args[0][0]
+    assert cmds and all(c.startswith("deltaC[") and c.endswith("=5") for c in cmds)
+    assert cmds[0] == f"deltaC[{DELTA_C_WRITABLE_START}]=5"
+    assert mock_ctrl.cmd_batch.call_args.kwargs == {"line_max": 80}
+
+
+def test_apply_delta_c_lines_stay_under_80_chars():
+    """deltaC writes keep the original 80-character command lines on the wire."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    from unittest.mock import MagicMock, patch
+
+    from dmccodegui.controller import GalilController
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    driver = MagicMock(spec=["GCommand"])
+    driver.GCommand.return_value = ""
+    ctrl = GalilController(driver=driver)
+    ctrl._connected = True
+    r.controller = ctrl
+    n = len(r._offsets_to_delta_c())
+    r._controller_delta_c = [0.0] * n
+    r._last_delta_c = [0.0] * n
+    r.delta_c_offsets = [5.0] * max(1, int(r.section_count))
+
+    captured_fn = []
+    with patch('dmccodegui.utils.jobs.submit', side_effect=captured_fn.append):
+        r.on_apply_delta_c()
+    captured_fn[0]()
+
+    lines = [c.args[0] for c in driver.GCommand.call_args_list]
+    assert len(lines) > 1
+    assert all(len(line) < 80 for line in lines)
+    assert sum(line.count("=") for line in lines) == n
+
+
 # ---------------------------------------------------------------------------
 # RUN-07: Live A/B Position Plot tests
 # ---------------------------------------------------------------------------
@@ -148,6 +209,24 @@ def test_plot_buffer_not_fed_by_apply_state():
     assert len(r._plot_buf_y) == 0, "Plot buffers should not be fed by _apply_state"
 
 
+def test_plot_tick_skipped_while_window_hidden():
+    """RUN-07: _tick_plot does no matplotlib work while the window is minimized."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    from unittest.mock import MagicMock, patch
+
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    r._plot_line = MagicMock()
+    r._plot_buf_x.extend([1.0, 2.0])
+    r._plot_buf_y.extend([1.0, 2.0])
+
+    with patch('dmccodegui.screens.flat_grind.run.window_hidden', return_value=True):
+        r._tick_plot(0.2)
+    r._plot_line.set_data.assert_not_called()
+
+
 def test_trail_clears_on_start():
     """RUN-07: on_start_grind() clears both plot buffers immediately."""
     os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
@@ -559,3 +638,87 @@ def test_more_stone_reads_startptc_before_and_after():
     assert len(mg_calls) == 2, (
         f"Expected exactly 2 'MG {STARTPT_C}' calls (before + after), got {len(mg_calls)}: {mg_calls}"
     )
+
+
+def _run_tick_pos(r, state):
+    """Run one FlatGrindRunScreen._tick_pos with *state* as the poll result.
+
+    The job and its Clock callback run inline; returns the scheduled callbacks.
+    """
+    from unittest.mock import MagicMock, patch
+
+    scheduled = []
+    ctrl = MagicMock()
+    ctrl.is_connected.return_value = True
+    r.controller = ctrl
+    with patch('dmccodegui.utils.jobs.submit', side_effect=lambda fn: fn()), \
+            patch('dmccodegui.screens.flat_grind.run.read_all_state', return_value=state), \
+            patch('kivy.clock.Clock.schedule_once', side_effect=scheduled.append):
+        r._tick_pos(0.2)
+    for cb in scheduled:
+        cb(0)
+    return scheduled
+
+
+def test_tick_pos_applies_result_and_clears_busy():
+    """_tick_pos schedules its _apply: positions update and the next tick may run."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    from dmccodegui.hmi.dmc_vars import STATE_GRINDING
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    r.cycle_running = True
+    scheduled = _run_tick_pos(r, (1000.0, 2000.0, 0.0, 0.0, STATE_GRINDING, 3, 7, 1))
+
+    assert len(scheduled) == 1
+    assert r._pos_busy is False
+    assert r.pos_a == "1,000"
+    assert r.session_knife_count == "3"
+    assert list(r._plot_buf_x) == [1000.0]
+    assert r.cycle_running is True
+
+
+def test_tick_pos_detects_grind_end_and_stops_poll():
+    """Grinding -> idle on a poll tick ends the cycle and stops the position poll."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    from unittest.mock import MagicMock
+
+    from dmccodegui.hmi.dmc_vars import STATE_IDLE
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    r.cycle_running = True
+    r.motion_active = True
+    r._grind_cmd_time = None
+    r._stop_pos_poll = MagicMock()
+    r._stop_elapsed = MagicMock()
+    r._read_start_pt_c = MagicMock()
+    _run_tick_pos(r, (0.0, 0.0, 0.0, 0.0, STATE_IDLE, 4, 8, 0))
+
+    assert r.cycle_running is False
+    assert r.motion_active is False
+    r._stop_pos_poll.assert_called_once()
+    r._stop_elapsed.assert_called_once()
+    r._read_start_pt_c.assert_called_once()
+
+
+def test_tick_pos_grind_end_waits_for_grace_period():
+    """Within _GRIND_GRACE_SEC of Start Grind an idle reading does not end the cycle."""
+    os.environ.setdefault('KIVY_NO_ENV_CONFIG', '1')
+    os.environ.setdefault('KIVY_LOG_LEVEL', 'critical')
+    import time
+    from unittest.mock import MagicMock
+
+    from dmccodegui.hmi.dmc_vars import STATE_IDLE
+    from dmccodegui.screens.flat_grind.run import FlatGrindRunScreen
+
+    r = FlatGrindRunScreen()
+    r.cycle_running = True
+    r._grind_cmd_time = time.monotonic()
+    r._stop_pos_poll = MagicMock()
+    _run_tick_pos(r, (0.0, 0.0, 0.0, 0.0, STATE_IDLE, 0, 0, 1))
+
+    assert r.cycle_running is True
+    r._stop_pos_poll.assert_not_called()
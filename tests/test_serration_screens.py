@@ -386,3 +386,30 @@ def test_serration_run_kv_has_bcomp():
     assert 'bcomp_panel' in content, (
         "ui/serration/run.kv must contain 'bcomp_panel' id — required for BCompPanel wiring"
     )
+
+
+# ---------------------------------------------------------------------------
+# 19. CompPanel.build_rows() reuses columns on refresh
+# ---------------------------------------------------------------------------
+
+def test_comp_panel_build_rows_reuses_columns():
+    """Refreshing with the same count keeps the widgets; count changes trim/extend."""
+    from dmccodegui.screens.serration.widgets import BCompPanel
+
+    panel = BCompPanel()
+    panel.build_rows([0.1, 0.2, 0.3])
+    first_cols = list(panel._columns)
+
+    panel.build_rows([1.0, 2.0, 3.0])
+    assert panel._columns == first_cols
+    assert [panel._val_labels[i].text for i in range(3)] == ['1.0', '2.0', '3.0']
+
+    panel.build_rows([5.0, 6.0])
+    assert panel.num_serrations == 2
+    assert panel._columns == first_cols[:2]
+    assert len(panel._strip.children) == 2
+    assert sorted(panel._val_labels) == [0, 1]
+
+    panel.build_rows([1.0, 2.0, 3.0, 4.0])
+    assert len(panel._strip.children) == 4
+    assert panel._val_labels[3].text == '4.0'